@@ -27,6 +27,11 @@ KiCad Integration Notes
 3. Exception handling: A thrown exception in a KiCad plugin can leave
    the UI in a weird state. Always be defensive.
 
+4. Startup cost: KiCad imports every plugin when pcbnew starts, whether or
+   not it is ever used. Only pcbnew (needed to subclass ActionPlugin) is
+   imported at module level; wx, the UI and manager modules (and everything
+   they pull in: subprocess, xml, shutil, ...) are only imported in Run().
+
 Author: Eliot Abramo
 License: MIT
 """
@@ -35,12 +40,13 @@ __version__ = "12.0"
 __author__ = "Eliot Abramo"
 
 import os
-import traceback
 
 import pcbnew
-import wx
 
-from .dialogs import MainDialog
+# Resolved once at import; defaults() may be called on every plugin refresh
+_ICON_PATH = os.path.join(os.path.dirname(__file__), "icon.png")
+_HAS_ICON = os.path.exists(_ICON_PATH)
+_DESCRIPTION = "Manage multiple PCBs from a single schematic"
 
 
 class MultiBoardPlugin(pcbnew.ActionPlugin):
@@ -50,15 +56,16 @@ class MultiBoardPlugin(pcbnew.ActionPlugin):
         """Set plugin metadata (called by KiCad during discovery)."""
         self.name = "Multi-Board Manager"
         self.category = "Project"
-        self.description = "Manage multiple PCBs from a single schematic"
+        self.description = _DESCRIPTION
         self.show_toolbar_button = True
 
-        icon_path = os.path.join(os.path.dirname(__file__), "icon.png")
-        if os.path.exists(icon_path):
-            self.icon_file_name = icon_path
+        if _HAS_ICON:
+            self.icon_file_name = _ICON_PATH
 
     def Run(self):
         """Plugin entry point (called when user clicks toolbar/menu)."""
+        import wx
+
         board = pcbnew.GetBoard()
 
         if not board:
@@ -72,10 +79,14 @@ class MultiBoardPlugin(pcbnew.ActionPlugin):
             return
 
         try:
+            from .dialogs import MainDialog
+
             dialog = MainDialog(None, board)
             dialog.ShowModal()
             dialog.Destroy()
         except Exception as e:
+            import traceback
+
             wx.MessageBox(
                 f"An error occurred:\n\n{e}\n\n"
                 f"Details:\n{traceback.format_exc()}",
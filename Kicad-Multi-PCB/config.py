@@ -5,6 +5,10 @@ Multi-Board PCB Manager - Configuration Data Model
 This module defines the JSON-serializable data structures persisted to disk
 in .kicad_multiboard.json
 
+Each to_dict() emits exactly the dataclass fields in declaration order. When
+orjson is installed the manager serializes the dataclasses directly, so keep
+the two in sync when adding fields.
+
 Data Model Overview
 -------------------
 
@@ -29,6 +33,7 @@ Author: Eliot Abramo
 License: MIT
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Dict
 
@@ -39,8 +44,12 @@ from .constants import (
     DEFAULT_PORT_POSITION,
 )
 
+# Slotted dataclasses drop the per-instance __dict__ (smaller objects, faster
+# attribute access). dataclass(slots=...) only exists on Python 3.10+.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class PortDef:
     """
     Inter-board electrical connection point.
@@ -77,15 +86,18 @@ class PortDef:
     @classmethod
     def from_dict(cls, data: dict) -> "PortDef":
         """Deserialize from dictionary."""
+        # Bound once: this runs for every port and board when a project loads
+        get = data.get
+        # Positional, in field order: skips keyword matching per port
         return cls(
-            name=data.get("name", ""),
-            net=data.get("net", ""),
-            side=data.get("side", "right"),
-            position=data.get("position", DEFAULT_PORT_POSITION),
+            get("name", ""),
+            get("net", ""),
+            get("side", "right"),
+            get("position", DEFAULT_PORT_POSITION),
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BoardConfig:
     """
     Configuration for a single sub-board.
@@ -113,6 +125,11 @@ class BoardConfig:
     block_height: float = DEFAULT_BLOCK_HEIGHT
     ports: Dict[str, PortDef] = field(default_factory=dict)
 
+    def __post_init__(self):
+        # Board names are repeated in every scan/status entry; interning keeps
+        # one shared object so lookups compare by identity first.
+        self.name = sys.intern(self.name)
+
     def to_dict(self) -> dict:
         """Serialize to dictionary for JSON storage."""
         return {
@@ -127,23 +144,26 @@ class BoardConfig:
     @classmethod
     def from_dict(cls, data: dict) -> "BoardConfig":
         """Deserialize from dictionary."""
-        config = cls(
+        get = data.get
+        ports = get("ports")
+        return cls(
             name=data["name"],
-            pcb_path=data.get("pcb_path", ""),
-            description=data.get("description", ""),
-            block_width=data.get("block_width", DEFAULT_BLOCK_WIDTH),
-            block_height=data.get("block_height", DEFAULT_BLOCK_HEIGHT),
+            pcb_path=get("pcb_path", ""),
+            description=get("description", ""),
+            block_width=get("block_width", DEFAULT_BLOCK_WIDTH),
+            block_height=get("block_height", DEFAULT_BLOCK_HEIGHT),
+            # Most boards have no ports: skip building the comprehension then
+            ports={
+                # Legacy format stored just the port name as a string
+                port_name: PortDef.from_dict(port_data) if isinstance(port_data, dict) else PortDef(name=port_name)
+                for port_name, port_data in ports.items()
+            }
+            if ports
+            else {},
         )
-        for port_name, port_data in data.get("ports", {}).items():
-            if isinstance(port_data, dict):
-                config.ports[port_name] = PortDef.from_dict(port_data)
-            else:
-                # Legacy format: just port name as string
-                config.ports[port_name] = PortDef(name=port_name)
-        return config
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProjectConfig:
     """
     Top-level multiboard project configuration.
@@ -177,15 +197,22 @@ class ProjectConfig:
     @classmethod
     def from_dict(cls, data: dict) -> "ProjectConfig":
         """Deserialize from dictionary."""
-        config = cls(
-            version=data.get("version", CONFIG_VERSION),
-            root_schematic=data.get("root_schematic", ""),
-            root_pcb=data.get("root_pcb", ""),
+        get = data.get
+        # Built in one comprehension rather than grown key by key
+        return cls(
+            version=get("version", CONFIG_VERSION),
+            root_schematic=get("root_schematic", ""),
+            root_pcb=get("root_pcb", ""),
+            boards={
+                sys.intern(board_name): _board_from_data(board_name, board_data)
+                for board_name, board_data in get("boards", {}).items()
+            },
         )
-        for board_name, board_data in data.get("boards", {}).items():
-            if isinstance(board_data, dict):
-                config.boards[board_name] = BoardConfig.from_dict(board_data)
-            else:
-                # Legacy format: just board name
-                config.boards[board_name] = BoardConfig(name=board_name, pcb_path="")
-        return config
+
+
+def _board_from_data(board_name: str, board_data) -> BoardConfig:
+    """Build one board entry, accepting the legacy bare-name format."""
+    if isinstance(board_data, dict):
+        return BoardConfig.from_dict(board_data)
+    # Legacy format: just board name
+    return BoardConfig(name=board_name, pcb_path="")
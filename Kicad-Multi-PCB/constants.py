@@ -31,6 +31,14 @@ BOARDS_DIR = "boards"
 CONFIG_FILE = ".kicad_multiboard.json"
 """Plugin configuration file name (hidden on Unix)."""
 
+SCAN_CACHE_FILE = ".kicad_multiboard.cache.json"
+"""
+Per-board scan results ({ref: footprint} plus the PCB's mtime/size).
+
+Lets the first dialog of a KiCad session skip re-scanning unchanged boards.
+Safe to delete; it is rebuilt on the next scan.
+"""
+
 # =============================================================================
 # Library Names
 # =============================================================================
@@ -86,8 +94,25 @@ Maximum footprints to process in parallel.
 Note: pcbnew is not thread-safe, so this is only used for pure Python work.
 """
 
+MAX_PARALLEL_SCANS = 8
+"""
+Maximum files read in parallel when scanning sub-board PCBs for references
+or walking the schematic sheet hierarchy.
+
+Only plain-text scans run in worker threads; boards that need the pcbnew
+fallback are still loaded on the main thread.
+"""
+
 PACK_GRID_SPACING = 10.0
 """Grid spacing for component packing in mm."""
 
 PACK_MAX_PER_ROW = 10
 """Maximum components per row when packing new footprints."""
+
+MAX_FAILED_IN_SUMMARY = 10
+"""
+Maximum failed footprints listed by name in the update summary.
+
+The rest are collapsed into a "... and N more" line so huge failures don't
+produce an oversized message box.
+"""
@@ -18,6 +18,7 @@ Custom Widgets:
     - SectionHeader: Title + subtitle for dialog sections
     - StatusIndicator: Bottom status bar for the main dialog
     - SearchBox: Filter input with clear button
+    - VirtualList: LC_VIRTUAL list that only renders the visible rows
 
 Dialogs:
     - PortEditDialog / PortDialog: Edit inter-board ports
@@ -46,6 +47,8 @@ License: MIT
 import os
 import shutil
 import subprocess
+import sys
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
@@ -55,7 +58,51 @@ import wx.grid as gridlib
 
 from .config import BoardConfig, PortDef
 from .constants import BOARDS_DIR
-from .manager import MultiBoardManager
+from .manager import RE_UNSAFE_NAME_CHAR, MultiBoardManager
+
+
+# =============================================================================
+# Message Templates
+# =============================================================================
+# Longer user-facing texts shared between handlers, filled with str.format()
+
+_BOARD_OPEN_MSG = "Board '{name}' is currently open in KiCad.\n\nPlease close it before {action}."
+
+_DELETE_CONFIRM_MSG = (
+    "Delete board '{name}'?\n\n"
+    "This will permanently remove:\n"
+    "• The board folder and all files\n"
+    "• All PCB layout work\n\n"
+    "The shared schematic will NOT be affected."
+)
+
+_UPDATE_ALL_CONFIRM_MSG = (
+    "Update all {count} boards from the schematic?\n\n"
+    "Each board is updated and saved in turn. Components not yet placed\n"
+    "on any board will ALL be added to the first board updated\n"
+    "('{first}', unless it is skipped), as if you pressed Update on\n"
+    "each board in order.\n\n"
+    "Boards open in KiCad are skipped."
+)
+
+
+# =============================================================================
+# System Opener
+# =============================================================================
+# Picked once at import instead of re-checking the platform on every click.
+# None (Linux) means callers launch KiCad themselves: xdg-open would go
+# through whatever MIME handler owns the JSON .kicad_pro, often a text editor
+# on Flatpak/AppImage installs, and still report success.
+
+if os.name == "nt":
+    _open_with_system = os.startfile
+elif sys.platform == "darwin":
+
+    def _open_with_system(path: str):
+        subprocess.Popen(["open", path])
+
+else:
+    _open_with_system = None
 
 
 # =============================================================================
@@ -309,6 +356,30 @@ class SearchBox(wx.Panel):
             super().Bind(event_type, handler)
 
 
+class VirtualList(wx.ListCtrl):
+    """
+    Report-style list that reads its rows from a Python list.
+
+    wx only asks for the visible cells, so showing thousands of rows is a
+    SetItemCount() call instead of one native insert per row.
+    """
+
+    def __init__(self, parent, columns):
+        super().__init__(parent, style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.LC_SINGLE_SEL | wx.BORDER_SIMPLE)
+        for col, (label, width) in enumerate(columns):
+            self.InsertColumn(col, label, width=width)
+        self._rows = []
+
+    def set_rows(self, rows):
+        """Show rows (sequence of per-column strings) and repaint."""
+        self._rows = rows
+        self.SetItemCount(len(rows))
+        self.Refresh()
+
+    def OnGetItemText(self, item, column):
+        return self._rows[item][column]
+
+
 # =============================================================================
 # Progress Dialog
 # =============================================================================
@@ -503,12 +574,21 @@ class PortDialog(BaseDialog):
         panel.SetSizer(main)
 
     def _refresh_list(self):
-        self.list.DeleteAllItems()
-        for name, port in sorted(self.ports.items()):
-            idx = self.list.InsertItem(self.list.GetItemCount(), name)
-            self.list.SetItem(idx, 1, port.net or "—")
-            self.list.SetItem(idx, 2, port.side.capitalize())
-            self.list.SetItem(idx, 3, f"{port.position:.0%}")
+        # Suspend painting so the rebuild redraws once, not once per cell
+        self.list.Freeze()
+        try:
+            self.list.DeleteAllItems()
+            rows = [
+                (name, port.net or "—", port.side.capitalize(), f"{port.position:.0%}")
+                for name, port in sorted(self.ports.items(), key=itemgetter(0))
+            ]
+            for idx, (name, net, side, position) in enumerate(rows):
+                self.list.InsertItem(idx, name)
+                self.list.SetItem(idx, 1, net)
+                self.list.SetItem(idx, 2, side)
+                self.list.SetItem(idx, 3, position)
+        finally:
+            self.list.Thaw()
 
     def _get_selected_name(self) -> Optional[str]:
         idx = self.list.GetFirstSelected()
@@ -612,7 +692,7 @@ class NewBoardDialog(BaseDialog):
         if name in self.existing:
             wx.MessageBox(f"Board '{name}' already exists.", "Validation", wx.ICON_WARNING)
             return
-        safe = "".join(c if c.isalnum() or c in "_-" else "" for c in name)
+        safe = RE_UNSAFE_NAME_CHAR.sub("", name)
         if not safe:
             wx.MessageBox("Name must contain at least one letter or number.", "Validation", wx.ICON_WARNING)
             return
@@ -677,22 +757,27 @@ class HealthReportDialog(BaseDialog):
         self.tree = wx.TreeCtrl(panel, style=wx.TR_DEFAULT_STYLE | wx.TR_HIDE_ROOT | wx.BORDER_SIMPLE)
         self.tree.SetFont(Fonts.body())
 
-        root = self.tree.AddRoot("Report")
-        for board_name, health in self.report.get("boards", {}).items():
-            status = health.get("status", "ok")
-            icon_char = {"ok": "✓", "warning": "⚠", "error": "✕"}.get(status, "?")
-            is_open = "◉ " if health.get("is_open") else ""
-
-            node = self.tree.AppendItem(root, f"{icon_char} {is_open}{board_name}")
-            self.tree.AppendItem(node, f"Components: {health.get('components', 0)}")
-            self.tree.AppendItem(node, f"Ports: {health.get('ports', 0)}")
-            self.tree.AppendItem(node, f"Modified: {health.get('last_modified', 'Unknown')}")
-            if health.get("is_open"):
-                self.tree.AppendItem(node, "◉ Currently open in KiCad")
-            if health.get("message"):
-                self.tree.AppendItem(node, f"Note: {health['message']}")
-
-        self.tree.ExpandAll()
+        # Build and expand while frozen: one layout/paint for the whole tree
+        self.tree.Freeze()
+        try:
+            root = self.tree.AddRoot("Report")
+            for board_name, health in self.report.get("boards", {}).items():
+                status = health.get("status", "ok")
+                icon_char = {"ok": "✓", "warning": "⚠", "error": "✕"}.get(status, "?")
+                is_open = "◉ " if health.get("is_open") else ""
+
+                node = self.tree.AppendItem(root, f"{icon_char} {is_open}{board_name}")
+                self.tree.AppendItem(node, f"Components: {health.get('components', 0)}")
+                self.tree.AppendItem(node, f"Ports: {health.get('ports', 0)}")
+                self.tree.AppendItem(node, f"Modified: {health.get('last_modified', 'Unknown')}")
+                if health.get("is_open"):
+                    self.tree.AppendItem(node, "◉ Currently open in KiCad")
+                if health.get("message"):
+                    self.tree.AppendItem(node, f"Note: {health['message']}")
+
+            self.tree.ExpandAll()
+        finally:
+            self.tree.Thaw()
         main.Add(self.tree, 1, wx.LEFT | wx.RIGHT | wx.EXPAND, Spacing.LG)
 
         btn_sizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -911,8 +996,8 @@ class StatusDialog(BaseDialog):
         self.header = SectionHeader(panel, "Component Placement", "Loading...")
         main.Add(self.header, 0, wx.ALL | wx.EXPAND, Spacing.LG)
 
-        self.tree = wx.TreeCtrl(panel, style=wx.TR_DEFAULT_STYLE | wx.TR_HIDE_ROOT | wx.BORDER_SIMPLE)
-        main.Add(self.tree, 1, wx.LEFT | wx.RIGHT | wx.EXPAND, Spacing.LG)
+        self.list = VirtualList(panel, [("Reference", 160), ("Board", 300)])
+        main.Add(self.list, 1, wx.LEFT | wx.RIGHT | wx.EXPAND, Spacing.LG)
 
         btn_sizer = wx.BoxSizer(wx.HORIZONTAL)
         btn_sizer.AddStretchSpacer()
@@ -938,32 +1023,28 @@ class StatusDialog(BaseDialog):
         subtitle.SetFont(Fonts.small())
         subtitle.SetForegroundColour(Colors.TEXT_SECONDARY)
         sizer.Add(subtitle, 0)
+
+        # Per-board counts, as the old grouped tree showed on each group node;
+        # the flat list below would otherwise need scrolling to tell them apart
+        per_board = self.manager.get_component_counts()
+        counts = "  •  ".join(f"{name}: {per_board.get(name, 0)}" for name in self.manager.config.boards)
+        if counts:
+            board_counts = wx.StaticText(self.header, label=counts)
+            board_counts.SetFont(Fonts.small())
+            board_counts.SetForegroundColour(Colors.TEXT_SECONDARY)
+            board_counts.Wrap(560)
+            sizer.Add(board_counts, 0, wx.TOP, Spacing.XS)
         self.header.SetSizer(sizer)
         self.header.Layout()
+        # The header may have grown a line: let the panel hand it the space
+        self.header.GetParent().Layout()
 
-        self.tree.DeleteAllItems()
-        root = self.tree.AddRoot("Status")
-
-        by_board: Dict[str, list] = {}
-        for ref, board in placed.items():
-            by_board.setdefault(board, []).append(ref)
-
-        for board_name in sorted(by_board.keys()):
-            refs = sorted(by_board[board_name])
-            node = self.tree.AppendItem(root, f"✓ {board_name} ({len(refs)} components)")
-            for ref in refs[:100]:
-                self.tree.AppendItem(node, f"    {ref}")
-            if len(refs) > 100:
-                self.tree.AppendItem(node, f"    ... +{len(refs) - 100} more")
-
-        if unplaced:
-            node = self.tree.AppendItem(root, f"○ Unplaced ({len(unplaced)} components)")
-            for ref in sorted(unplaced)[:100]:
-                self.tree.AppendItem(node, f"    {ref}")
-            if len(unplaced) > 100:
-                self.tree.AppendItem(node, f"    ... +{len(unplaced) - 100} more")
-
-        self.tree.ExpandAll()
+        # Placed refs grouped by board, unplaced last. Both sorts use C key
+        # getters; the second is stable, so refs stay ordered within a board.
+        rows = sorted(((ref, f"✓ {board}") for ref, board in placed.items()), key=itemgetter(0))
+        rows.sort(key=itemgetter(1))
+        rows.extend((ref, "○ Unplaced") for ref in sorted(unplaced))
+        self.list.set_rows(rows)
 
 
 # =============================================================================
@@ -1050,6 +1131,10 @@ class MainDialog(BaseDialog):
         # Board table (Grid) with Status column
         self.grid = gridlib.Grid(content)
         self.grid.CreateGrid(0, 6)
+        # What each grid row currently shows: (cell values, is_current, is_open)
+        self._grid_rows: List[tuple] = []
+        # Last selection state the action buttons were enabled for
+        self._has_selection: Optional[bool] = None
         self.grid.SetFont(Fonts.body())
 
         self.grid.SetRowLabelSize(0)
@@ -1184,7 +1269,7 @@ class MainDialog(BaseDialog):
             if name:
                 self._on_update(None)
             else:
-                self._refresh_list()
+                self._refresh_list(rescan=True)
         elif key == wx.WXK_DELETE or key == wx.WXK_BACK:
             self._on_remove(None)
         elif key == wx.WXK_RETURN:
@@ -1198,22 +1283,26 @@ class MainDialog(BaseDialog):
         else:
             event.Skip()
 
-    def _refresh_list(self):
+    def _refresh_list(self, rescan: bool = False):
+        """
+        Repopulate the board grid.
+
+        Every refresh stats each board PCB and re-reads only the ones whose
+        mtime or size changed, so edits saved in KiCad always show up.
+        `rescan` (F5) drops the cached results and re-reads every board,
+        for the cases a stat can't see (e.g. a copy that kept its mtime).
+        """
         self.status_bar.set_status("Refreshing...", "working")
         wx.Yield()
 
-        self.manager._scan_cache = None
-        self.manager._health_cache.clear()
+        if rescan:
+            self.manager.invalidate_caches()
+            self.manager.scan_all_boards(force=True)
 
         filter_text = self.search_box.GetValue().lower()
 
-        if self.grid.GetNumberRows() > 0:
-            self.grid.DeleteRows(0, self.grid.GetNumberRows())
-
-        placed = self.manager.scan_all_boards()
-        counts: Dict[str, int] = {}
-        for ref, (board, _) in placed.items():
-            counts[board] = counts.get(board, 0) + 1
+        # Gather everything first so the grid isn't left empty during the scan
+        counts = self.manager.get_component_counts()
 
         current_board = self._get_current_board_name()
         open_boards = self.manager.get_open_boards()
@@ -1225,45 +1314,82 @@ class MainDialog(BaseDialog):
                     continue
             boards.append((name, board))
 
-        if boards:
-            self.grid.AppendRows(len(boards))
-
-        wrap_renderer = gridlib.GridCellAutoWrapStringRenderer()
-
-        for row, (name, board) in enumerate(boards):
+        rows = []
+        for name, board in boards:
             is_open = name in open_boards
             is_current = name == current_board
-
             if is_open:
                 status = "◉ Open"
             elif is_current:
                 status = "→ Current"
             else:
                 status = "✓"
+            values = (
+                status,
+                name,
+                str(counts.get(name, 0)),
+                str(len(board.ports)),
+                board.description or "—",
+                board.pcb_path or "",
+            )
+            rows.append((values, is_current, is_open))
 
-            self.grid.SetCellValue(row, 0, status)
-            self.grid.SetCellValue(row, 1, name)
-            self.grid.SetCellValue(row, 2, str(counts.get(name, 0)))
-            self.grid.SetCellValue(row, 3, str(len(board.ports)))
-            self.grid.SetCellValue(row, 4, board.description or "—")
-            self.grid.SetCellValue(row, 5, board.pcb_path or "")
-
-            self.grid.SetCellRenderer(row, 4, wrap_renderer)
-            self.grid.SetCellRenderer(row, 5, wrap_renderer)
-
-            for col in range(6):
-                self.grid.SetReadOnly(row, col, True)
+        # Only touch rows whose content changed since the last refresh; most
+        # refreshes (filtering, reopening the dialog, F5) change few or none.
+        if rows == self._grid_rows:
+            self._update_summary(counts, open_boards)
+            self._on_selection_changed(None)
+            return
+        old_rows = self._grid_rows
+        self._grid_rows = rows
 
-            if is_current:
-                for col in range(6):
-                    self.grid.SetCellBackgroundColour(row, col, Colors.SELECTED)
-            elif is_open:
+        # Batch the grid edits: without this every SetCellValue/colour call
+        # schedules its own repaint (very visible on Windows).
+        self.grid.BeginBatch()
+        try:
+            old_count = self.grid.GetNumberRows()
+            if old_count > len(rows):
+                self.grid.DeleteRows(len(rows), old_count - len(rows))
+            elif old_count < len(rows):
+                self.grid.AppendRows(len(rows) - old_count)
+
+            wrap_renderer = gridlib.GridCellAutoWrapStringRenderer()
+            default_bg = self.grid.GetDefaultCellBackgroundColour()
+            default_fg = self.grid.GetDefaultCellTextColour()
+
+            for row, entry in enumerate(rows):
+                if row < old_count:
+                    if entry == old_rows[row]:
+                        continue
+                else:
+                    # Fresh row: set the per-cell attributes once
+                    self.grid.SetCellRenderer(row, 4, wrap_renderer)
+                    self.grid.SetCellRenderer(row, 5, wrap_renderer)
+                    for col in range(6):
+                        self.grid.SetReadOnly(row, col, True)
+
+                values, is_current, is_open = entry
+                for col, value in enumerate(values):
+                    self.grid.SetCellValue(row, col, value)
+
+                if is_current:
+                    bg = Colors.SELECTED
+                elif is_open:
+                    bg = Colors.OPEN_BG
+                else:
+                    bg = default_bg
                 for col in range(6):
-                    self.grid.SetCellBackgroundColour(row, col, Colors.OPEN_BG)
-                self.grid.SetCellTextColour(row, 0, Colors.WARNING)
+                    self.grid.SetCellBackgroundColour(row, col, bg)
+                self.grid.SetCellTextColour(row, 0, Colors.WARNING if is_open and not is_current else default_fg)
+        finally:
+            self.grid.EndBatch()
 
         self._autosize_grid_rows()
+        self._update_summary(counts, open_boards)
+        self._on_selection_changed(None)
 
+    def _update_summary(self, counts: Dict[str, int], open_boards: Set[str]):
+        """Board badge, open-board indicator and status bar text."""
         total_boards = len(self.manager.config.boards)
         total_components = sum(counts.values())
         self.board_count_badge.SetLabel(f"{total_boards} board(s)")
@@ -1274,7 +1400,6 @@ class MainDialog(BaseDialog):
             self.open_indicator.SetLabel("")
 
         self.status_bar.set_status(f"{total_boards} board(s), {total_components} component(s) placed", "ok")
-        self._on_selection_changed(None)
 
     def _autosize_grid_rows(self):
         if self.grid.GetNumberRows() <= 0:
@@ -1293,32 +1418,23 @@ class MainDialog(BaseDialog):
         self._refresh_list()
 
     def _get_current_board_name(self) -> Optional[str]:
-        try:
-            board = pcbnew.GetBoard()
-            if board:
-                pcb_path = Path(board.GetFileName())
-                for name, cfg in self.manager.config.boards.items():
-                    board_pcb = self.manager.project_dir / cfg.pcb_path
-                    try:
-                        if pcb_path.resolve() == board_pcb.resolve():
-                            return name
-                    except Exception:
-                        if pcb_path.name == board_pcb.name:
-                            return name
-        except Exception:
-            pass
+        # Resolve the active board once, not once per configured board
+        active = self.manager.get_active_board_path()
+        if active is None:
+            return None
+        for name, cfg in self.manager.config.boards.items():
+            if self.manager.resolve_path(self.manager.get_pcb_path(cfg)) == active:
+                return name
         return None
 
     def _get_selected_name(self) -> Optional[str]:
         rows = self.grid.GetSelectedRows()
-        if rows:
-            row = rows[0]
-        else:
-            row = self.grid.GetGridCursorRow()
-            if row < 0 or row >= self.grid.GetNumberRows():
-                return None
-        name = self.grid.GetCellValue(row, 1)  # Board name is column 1
-        return name or None
+        row = rows[0] if rows else self.grid.GetGridCursorRow()
+        # Read the name from the rows the grid was filled from (column 1)
+        # rather than asking the grid for the cell text
+        if 0 <= row < len(self._grid_rows):
+            return self._grid_rows[row][0][1] or None
+        return None
 
     def _on_grid_select(self, event):
         event.Skip()
@@ -1326,6 +1442,10 @@ class MainDialog(BaseDialog):
 
     def _on_selection_changed(self, event):
         has_selection = self._get_selected_name() is not None
+        # Fires on every cell click; only touch the buttons when it flips
+        if has_selection == self._has_selection:
+            return
+        self._has_selection = has_selection
         self.btn_remove.Enable(has_selection)
         self.btn_open.Enable(has_selection)
         self.btn_update.Enable(has_selection)
@@ -1345,6 +1465,7 @@ class MainDialog(BaseDialog):
         menu = wx.Menu()
         menu.Append(101, "Open Board\tEnter")
         menu.Append(102, "Update from Schematic\tF5")
+        menu.Append(108, "Update All Boards")
         menu.Append(103, "Configure Ports...")
         menu.Append(104, "Edit Description...")
         menu.AppendSeparator()
@@ -1355,7 +1476,7 @@ class MainDialog(BaseDialog):
 
         board = self.manager.config.boards.get(name)
         if board:
-            pcb_path = self.manager.project_dir / board.pcb_path
+            pcb_path = self.manager.get_pcb_path(board)
             if self.manager.is_pcb_open(pcb_path):
                 menu.Enable(102, False)
                 menu.Enable(107, False)
@@ -1367,6 +1488,7 @@ class MainDialog(BaseDialog):
         self.Bind(wx.EVT_MENU, self._on_board_health, id=105)
         self.Bind(wx.EVT_MENU, self._on_copy_path, id=106)
         self.Bind(wx.EVT_MENU, self._on_remove, id=107)
+        self.Bind(wx.EVT_MENU, self._on_update_all, id=108)
 
         self.PopupMenu(menu)
         menu.Destroy()
@@ -1406,12 +1528,14 @@ class MainDialog(BaseDialog):
             success, msg = self.manager.create_board(dlg.result_name, dlg.result_desc)
             if success:
                 self.status_bar.set_status(f"Created '{dlg.result_name}'", "ok")
-                wx.MessageBox(
+                self._refresh_list()
+                # Informational only: post it so the grid repaints before the modal box
+                wx.CallAfter(
+                    wx.MessageBox,
                     f"Board '{dlg.result_name}' created.\n\nUse Update to assign components.",
                     "Board Created",
                     wx.ICON_INFORMATION,
                 )
-                self._refresh_list()
             else:
                 self.status_bar.set_status("Creation failed", "error")
                 wx.MessageBox(msg, "Error", wx.ICON_ERROR)
@@ -1425,21 +1549,17 @@ class MainDialog(BaseDialog):
         if not board:
             return
 
-        pcb_path = self.manager.project_dir / board.pcb_path
+        pcb_path = self.manager.get_pcb_path(board)
         if self.manager.is_pcb_open(pcb_path):
             wx.MessageBox(
-                f"Board '{name}' is currently open in KiCad.\n\nPlease close it before deleting.",
+                _BOARD_OPEN_MSG.format(name=name, action="deleting"),
                 "Cannot Delete",
                 wx.ICON_WARNING,
             )
             return
 
         result = wx.MessageBox(
-            f"Delete board '{name}'?\n\n"
-            "This will permanently remove:\n"
-            "• The board folder and all files\n"
-            "• All PCB layout work\n\n"
-            "The shared schematic will NOT be affected.",
+            _DELETE_CONFIRM_MSG.format(name=name),
             "Confirm Deletion",
             wx.YES_NO | wx.NO_DEFAULT | wx.ICON_WARNING,
         )
@@ -1455,7 +1575,7 @@ class MainDialog(BaseDialog):
 
         del self.manager.config.boards[name]
         self.manager.save_config()
-        self.manager._scan_cache = None
+        self.manager.invalidate_caches()
         self.status_bar.set_status(f"Removed '{name}'", "ok")
         self._refresh_list()
 
@@ -1467,25 +1587,28 @@ class MainDialog(BaseDialog):
         if not board:
             return
 
-        pcb_path = self.manager.project_dir / board.pcb_path
+        pcb_path = self.manager.get_pcb_path(board)
         pro_path = pcb_path.with_suffix(".kicad_pro")
-        target = pro_path if pro_path.exists() else pcb_path
 
-        if not target.exists():
-            wx.MessageBox(f"File not found:\n{target}", "Error", wx.ICON_ERROR)
+        # One stat per candidate: the project file wins, the PCB is the fallback
+        if pro_path.exists():
+            target = pro_path
+        elif pcb_path.exists():
+            target = pcb_path
+        else:
+            wx.MessageBox(f"File not found:\n{pcb_path}", "Error", wx.ICON_ERROR)
             return
 
         self.status_bar.set_status(f"Opening '{name}'...", "working")
         try:
-            if os.name == "nt":
-                os.startfile(str(target))
-            elif os.uname().sysname == "Darwin":
-                subprocess.Popen(["open", str(target)])
+            if _open_with_system is not None:
+                _open_with_system(str(target))
             else:
-                try:
-                    subprocess.Popen(["kicad", str(pro_path if pro_path.exists() else target)])
-                except FileNotFoundError:
-                    subprocess.Popen(["pcbnew", str(pcb_path)])
+                kicad = self.manager.find_executable("kicad")
+                if kicad:
+                    subprocess.Popen([kicad, str(target)])
+                else:
+                    subprocess.Popen([self.manager.find_executable("pcbnew") or "pcbnew", str(pcb_path)])
             self.status_bar.set_status(f"Opened '{name}'", "ok")
         except Exception as e:
             self.status_bar.set_status("Open failed", "error")
@@ -1497,10 +1620,10 @@ class MainDialog(BaseDialog):
             return
         board = self.manager.config.boards.get(name)
         if board:
-            pcb_path = self.manager.project_dir / board.pcb_path
+            pcb_path = self.manager.get_pcb_path(board)
             if self.manager.is_pcb_open(pcb_path):
                 wx.MessageBox(
-                    f"Board '{name}' is currently open in KiCad.\n\nPlease close it before updating.",
+                    _BOARD_OPEN_MSG.format(name=name, action="updating"),
                     "Cannot Update",
                     wx.ICON_WARNING,
                 )
@@ -1512,18 +1635,62 @@ class MainDialog(BaseDialog):
         self.status_bar.set_status(f"Updating '{name}'...", "working")
 
         try:
-            success, msg = self.manager.update_board(name, progress_callback=lambda p, m: (progress.update(p, m), wx.Yield()))
+            # The progress callback yields to the event loop: disable every
+            # other window so the board can't be removed, the dialog closed or
+            # a second update started while this one runs
+            with wx.BusyCursor(), wx.WindowDisabler(progress):
+                success, msg = self.manager.update_board(name, progress_callback=lambda p, m: (progress.update(p, m), wx.Yield()))
             progress.Destroy()
 
             if success:
                 self.status_bar.set_status(f"Updated '{name}'", "ok")
                 if "Added:" in msg and not msg.startswith("Added: 0"):
                     msg += "\n\nTip: Select new components and press 'P' to pack them."
-                wx.MessageBox(f"Update complete:\n\n{msg}", "Success", wx.ICON_INFORMATION)
+                self._refresh_list()
+                wx.CallAfter(wx.MessageBox, f"Update complete:\n\n{msg}", "Success", wx.ICON_INFORMATION)
             else:
                 self.status_bar.set_status("Update failed", "error")
                 wx.MessageBox(msg, "Update Failed", wx.ICON_ERROR)
+                self._refresh_list()
+        except Exception as e:
+            progress.Destroy()
+            self.status_bar.set_status("Update failed", "error")
+            wx.MessageBox(str(e), "Error", wx.ICON_ERROR)
+
+    def _on_update_all(self, event):
+        names = list(self.manager.config.boards)
+        if not names:
+            return
+        result = wx.MessageBox(
+            _UPDATE_ALL_CONFIRM_MSG.format(count=len(names), first=names[0]),
+            "Confirm Update All",
+            wx.YES_NO | wx.NO_DEFAULT | wx.ICON_WARNING,
+        )
+        if result != wx.YES:
+            return
+
+        progress = ProgressDialog(self, "Updating All Boards")
+        progress.Show()
+        wx.Yield()
+        self.status_bar.set_status("Updating all boards...", "working")
+
+        try:
+            # As in _on_update: only the progress dialog stays enabled
+            with wx.BusyCursor(), wx.WindowDisabler(progress):
+                success, msg = self.manager.update_all_boards(progress_callback=lambda p, m: (progress.update(p, m), wx.Yield()))
+            progress.Destroy()
+
+            if success:
+                self.status_bar.set_status("Updated all boards", "ok")
+            else:
+                self.status_bar.set_status("Some boards were not updated", "warning")
             self._refresh_list()
+            wx.CallAfter(
+                wx.MessageBox,
+                f"Update results:\n\n{msg}",
+                "Update All",
+                wx.ICON_INFORMATION if success else wx.ICON_WARNING,
+            )
         except Exception as e:
             progress.Destroy()
             self.status_bar.set_status("Update failed", "error")
@@ -1619,7 +1786,7 @@ class MainDialog(BaseDialog):
             return
         board = self.manager.config.boards.get(name)
         if board:
-            path = str(self.manager.project_dir / board.pcb_path)
+            path = str(self.manager.get_pcb_path(board))
             if wx.TheClipboard.Open():
                 wx.TheClipboard.SetData(wx.TextDataObject(path))
                 wx.TheClipboard.Close()
@@ -1627,3 +1794,8 @@ class MainDialog(BaseDialog):
 
     def _on_close(self, event):
         self.Destroy()
+
+    def Destroy(self):
+        # Both the close button and the plugin's Run() end up here
+        self.manager.close()
+        return super().Destroy()
@@ -37,6 +37,7 @@ Performance design
 ------------------
 - Cache scan results: scanning every board's footprints repeatedly is slow.
 - Use lxml when available: netlist parsing is a hot path.
+- Use orjson when available to load/save the config file (stdlib json otherwise).
 - Avoid repeated library lookups: cache lib paths and failed footprint loads.
 - Keep filesystem touches minimal: KiCad + network drives can be problematic.
 
@@ -48,35 +49,311 @@ Author: Eliot Abramo
 License: MIT
 """
 
+import functools
 import json
 import math
+import mmap
 import os
 import re
 import shutil
 import subprocess
+import sys
+import threading
+import time
 import traceback
 from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 import pcbnew
 
+try:
+    import orjson  # Optional C serializer; KiCad's bundled Python may not have it
+except ImportError:
+    orjson = None
+
+# bytes -> object. Both accept bytes, so callers skip the text decode step.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Resolved once at import rather than on every parse
+try:
+    from lxml import etree as _xml
+
+    _HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as _xml
+
+    _HAS_LXML = False
+
 from .config import BoardConfig, PortDef, ProjectConfig
 from .constants import (
     BLOCK_LIB_NAME,
     BOARDS_DIR,
     CONFIG_FILE,
     DEBUG_LOG_NAME,
+    MAX_FAILED_IN_SUMMARY,
+    MAX_PARALLEL_SCANS,
     PACK_GRID_SPACING,
     PACK_MAX_PER_ROW,
     PORT_LIB_NAME,
+    SCAN_CACHE_FILE,
     TEMP_NETLIST_NAME,
 )
 
+# <node> children of a netlist <net>. Under lxml a compiled XPath runs in C;
+# findall would go through lxml's Python ElementPath layer on every net.
+if _HAS_LXML:
+    _net_nodes = _xml.XPath("node")
+else:
+
+    def _net_nodes(net) -> list:
+        return net.findall("node")
+
 # Pre-compiled regex patterns for performance
-RE_FP_LIB_ENTRY = re.compile(r'\(name\s*"([^"]+)"\).*?\(uri\s*"([^"]+)"\)', re.DOTALL)
-RE_SHEET_REF = re.compile(r'"([^"]+\.kicad_sch)"')
+RE_SHEET_REF = re.compile(rb'"([^"]+\.kicad_sch)"')
+# Anything str.isalnum() rejects, other than "_" and "-" (\w is isalnum + "_")
+RE_UNSAFE_NAME_CHAR = re.compile(r"[^\w-]")
+RE_PCB_FOOTPRINT = re.compile(rb'\(footprint\s+"([^"]*)"')
+# KiCad 8+ stores the reference as a property; KiCad 6/7 as fp_text
+RE_PCB_REFERENCE = re.compile(rb'\(property\s+"Reference"\s+"([^"]*)"|\(fp_text\s+reference\s+"([^"]*)"')
+# ${VAR} path variable in a library table uri
+RE_PATH_VAR = re.compile(r"\$\{([^}]*)\}")
+
+# Skeleton written for every new sub-board. Kept as bytes: no per-call encode
+# and no newline translation on Windows.
+_EMPTY_PCB = b'''(kicad_pcb
+  (version 20240108) (generator "multiboard") (generator_version "9.0")
+  (general (thickness 1.6) (legacy_teardrops no)) (paper "A4")
+  (layers
+    (0 "F.Cu" signal) (31 "B.Cu" signal)
+    (36 "B.SilkS" user) (37 "F.SilkS" user)
+    (38 "B.Mask" user) (39 "F.Mask" user)
+    (44 "Edge.Cuts" user) (47 "F.CrtYd" user) (49 "F.Fab" user))
+  (setup (pad_to_mask_clearance 0)) (net 0 ""))
+'''
+
+# References that never count as placed parts: power/flag symbols ("#PWR",
+# "#FLG") and "MB_" multi-board markers. str.startswith takes the tuple
+# directly, so this is a single call per reference.
+_SKIP_REF_PREFIXES = ("#", "MB_")
+
+# Netlist boolean property values that mean "true". KiCad writes boolean
+# properties with an EMPTY value, so "" is included.
+_TRUTHY = frozenset(("", "yes", "true", "1"))
+_DNP_TRUTHY = _TRUTHY | {"dnp"}
+
+# Netlist sections the parser never reads. They can rival the components in
+# size (every symbol's pin list), so they're discarded as soon as they close.
+_UNUSED_NETLIST_TAGS = frozenset(("design", "libparts", "libraries"))
+# Parsed sections: by the time they close they only hold the emptied
+# <comp>/<net> shells, which are dropped along with them.
+_DISCARD_NETLIST_TAGS = _UNUSED_NETLIST_TAGS | {"components", "nets"}
+
+# Property-name classification bits. A netlist only uses a few dozen distinct
+# property names across thousands of components, so each raw name is
+# normalized and classified once, then looked up.
+_PROP_DNP = 1
+_PROP_EXCLUDE = 2
+_prop_kinds: Dict[str, int] = {}
+
+
+def _classify_prop(name: str) -> int:
+    """Bitmask of _PROP_* flags for a netlist property/field name."""
+    kind = _prop_kinds.get(name)
+    if kind is None:
+        # Normalize for comparison: "Exclude from board" -> "exclude_from_board"
+        normalized = name.strip().lower().replace(" ", "_").replace("-", "_")
+        kind = 0
+        if normalized == "dnp":
+            kind |= _PROP_DNP
+        # Also matches the ki_exclude_from_board variant
+        if "exclude" in normalized and "board" in normalized:
+            kind |= _PROP_EXCLUDE
+        _prop_kinds[name] = kind
+    return kind
+
+
+def _release(elem) -> None:
+    """
+    Free a netlist element once it has been read.
+
+    With lxml this is the usual fast_iter idiom: the emptied siblings that
+    came before are unlinked too, so <components>/<nets> never accumulate
+    thousands of empty shells. ElementTree has no parent pointers; there the
+    shells stay until their section closes and is cleared as a whole.
+    """
+    elem.clear()
+    if _HAS_LXML:
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def _list_dir_names(directory: Path) -> List[str]:
+    """Entry names of a directory in scandir order (empty if unreadable)."""
+    try:
+        with os.scandir(directory) as it:
+            return [entry.name for entry in it]
+    except OSError:
+        return []
+
+
+def _is_kicad_pro(name: str) -> bool:
+    """Same match as glob("*.kicad_pro"), which skips dot-files."""
+    return name.endswith(".kicad_pro") and not name.startswith(".")
+
+
+def _version_key(name: str) -> Tuple[int, Tuple[int, ...], str]:
+    """
+    Sort key for KiCad install folders: numeric versions ("10.0" > "9.0"),
+    which plain string sorting gets wrong, ahead of anything non-numeric.
+    """
+    try:
+        return (1, tuple(int(part) for part in name.split(".")), name)
+    except ValueError:
+        return (0, (), name)
+
+
+def _scan_pcb_refs(pcb_path: Path) -> Optional[Dict[str, str]]:
+    """
+    {ref: "lib:fp"} for the footprints in a .kicad_pcb, read straight from the file.
+
+    Scanning the S-expression text for footprint headers and their
+    Reference is far cheaper than pcbnew.LoadBoard, which builds every
+    track, zone and drawing just so we can read GetReference(). Returns
+    None whenever the text doesn't look as expected (legacy (module ...)
+    files, escaped quotes, a footprint without a reference) so the caller
+    can fall back to LoadBoard.
+
+    The file is memory-mapped rather than read: boards with large zones
+    run to tens of MB and the regexes only need to page through them once.
+    """
+    try:
+        with open(pcb_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return {}
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _scan_pcb_buffer(data)
+    except (OSError, ValueError):
+        return None
+
+
+def _scan_pcb_buffer(data) -> Optional[Dict[str, str]]:
+    """_scan_pcb_refs() over the PCB contents (bytes or an mmap)."""
+    headers = list(RE_PCB_FOOTPRINT.finditer(data))
+    if not headers:
+        # Genuinely empty board, unless it's a legacy file using (module ...)
+        return None if data.find(b"(module") != -1 else {}
+
+    refs = {}
+    for i, header in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(data)
+        match = RE_PCB_REFERENCE.search(data, header.end(), end)
+        if match is None:
+            return None
+        raw_ref = match.group(1) if match.group(1) is not None else match.group(2)
+        raw_id = header.group(1)
+        if b"\\" in raw_ref or b"\\" in raw_id:
+            return None
+        ref = raw_ref.decode("utf-8", "replace")
+        if ref and not ref.startswith(_SKIP_REF_PREFIXES):
+            fp_id = raw_id.decode("utf-8", "replace")
+            # GetFPID() formats a library-less id as ":name"
+            refs[ref] = sys.intern(fp_id if ":" in fp_id else f":{fp_id}")
+    return refs
+
+
+def _quoted_after(text: str, token: str, start: int, end: int) -> Optional[str]:
+    """The first "..." string following token within text[start:end], if any."""
+    pos = text.find(token, start, end)
+    if pos < 0:
+        return None
+    open_q = text.find('"', pos + len(token), end)
+    if open_q < 0:
+        return None
+    close_q = text.find('"', open_q + 1, end)
+    if close_q < 0:
+        return None
+    return text[open_q + 1 : close_q]
+
+
+def _iter_lib_entries(content: str) -> Iterator[Tuple[str, str]]:
+    """
+    (nickname, uri) for each (lib ...) entry of a library table.
+
+    A linear str.find walk: each entry is bounded by the next "(lib", so
+    there is no DOTALL backtracking between a name and its uri. Entries
+    missing either field are skipped.
+    """
+    start = content.find("(lib")
+    while start >= 0:
+        end = content.find("(lib", start + 4)
+        stop = end if end >= 0 else len(content)
+        name = _quoted_after(content, "(name", start, stop)
+        if name:
+            uri = _quoted_after(content, "(uri", start, stop)
+            if uri:
+                yield name, uri
+        start = end
+
+
+@functools.lru_cache(maxsize=512)
+def _expand_lib_uri(uri: str, project_dir: str) -> Optional[Path]:
+    """
+    Library path for a table uri, or None if it uses a variable we can't expand.
+
+    ${KIPRJMOD} is the project dir; other variables (KICAD8_FOOTPRINT_DIR,
+    user paths) come from the environment KiCad exports to plugins. All are
+    substituted in one pass over the uri.
+
+    Memoized per process: each dialog open builds a new manager and re-reads
+    the same table, so the expansions repeat entry for entry. KiCad sets its
+    path variables at startup, so the environment is stable for that long.
+    """
+    if "${" not in uri:
+        return Path(uri)
+    unresolved = False
+
+    def lookup(match):
+        nonlocal unresolved
+        name = match.group(1)
+        value = project_dir if name == "KIPRJMOD" else os.environ.get(name)
+        if value is None:
+            unresolved = True
+            return match.group(0)
+        return value
+
+    expanded = RE_PATH_VAR.sub(lookup, uri)
+    return None if unresolved else Path(expanded)
+
+
+def _exclusive_update(method):
+    """
+    Refuse to start an update while another one is running.
+
+    The dialogs pump the event loop during the netlist export, and two
+    exports would race on the same TEMP_NETLIST_NAME file.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self._update_lock.acquire(blocking=False):
+            return False, "Another update is still running."
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._update_lock.release()
+
+    return wrapper
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Stat a path, returning None if it doesn't exist (one syscall, not two)."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
 
 
 class SchematicLinkError(Exception):
@@ -90,7 +367,7 @@ class SchematicLinkError(Exception):
 # Footprint loading is one of the main places KiCad plugins fall over.
 # The pcbnew API is SWIG-wrapped, and object lifetime/ownership can be
 # delicate. The safest pattern I've found is:
-#   - cache library paths (cheap)
+#   - cache library paths (cheap), and which source worked for each library
 #   - load footprints fresh every time (safe)
 #   - remember failures so we don't keep hammering the disk
 
@@ -107,12 +384,16 @@ class FootprintResolver:
         self._lib_paths: Dict[str, Path] = {}
         self._kicad_share: Optional[Path] = None
         self._failed: Set[str] = set()  # Cache failed lookups
+        self._lib_sources: Dict[str, List[str]] = {}  # lib_nick -> paths to try, in order
+        self._lib_hits: Dict[str, str] = {}  # lib_nick -> path that last loaded
 
     def set_lib_paths(self, paths: Dict[str, Path], kicad_share: Optional[Path]):
         """Set library path mappings."""
         self._lib_paths = paths
         self._kicad_share = kicad_share
         self._failed.clear()
+        self._lib_sources.clear()
+        self._lib_hits.clear()
 
     def load(self, lib_nick: str, fp_name: str) -> Optional[pcbnew.FOOTPRINT]:
         """
@@ -131,29 +412,48 @@ class FootprintResolver:
             self._failed.add(cache_key)
         return fp
 
+    def _sources_for(self, lib_nick: str) -> List[str]:
+        """Candidate library paths for a nickname, resolved once per library."""
+        sources = self._lib_sources.get(lib_nick)
+        if sources is None:
+            sources = []
+            # Project library path first, unless it isn't on disk: a table
+            # entry for a moved or uninstalled library would otherwise cost a
+            # failing FootprintLoad (and its exception) for every footprint.
+            # exists(), not isdir(): file-based libraries (Eagle .lbr, legacy
+            # .mod) are valid too, FootprintLoad picks the plugin by path.
+            lib_path = self._lib_paths.get(lib_nick)
+            if lib_path is not None and os.path.exists(lib_path):
+                sources.append(str(lib_path))
+            # Then the KiCad standard library
+            if self._kicad_share:
+                std_path = self._kicad_share / "footprints" / f"{lib_nick}.pretty"
+                if os.path.isdir(std_path):
+                    sources.append(str(std_path))
+            # Finally direct loading (absolute path or global lib)
+            sources.append(lib_nick)
+            self._lib_sources[lib_nick] = sources
+        return sources
+
     def _try_load(self, lib_nick: str, fp_name: str) -> Optional[pcbnew.FOOTPRINT]:
         """Attempt to load footprint from various sources."""
-        # Try project library path first
-        if lib_nick in self._lib_paths:
+        # Most footprints of a library come from the same place: start there
+        hit = self._lib_hits.get(lib_nick)
+        if hit is not None:
             try:
-                return pcbnew.FootprintLoad(str(self._lib_paths[lib_nick]), fp_name)
+                return pcbnew.FootprintLoad(hit, fp_name)
             except Exception:
                 pass
 
-        # Try KiCad standard library
-        if self._kicad_share:
-            std_path = self._kicad_share / "footprints" / f"{lib_nick}.pretty"
-            if std_path.exists():
-                try:
-                    return pcbnew.FootprintLoad(str(std_path), fp_name)
-                except Exception:
-                    pass
-
-        # Try direct loading (absolute path or global lib)
-        try:
-            return pcbnew.FootprintLoad(lib_nick, fp_name)
-        except Exception:
-            pass
+        for source in self._sources_for(lib_nick):
+            if source == hit:
+                continue
+            try:
+                fp = pcbnew.FootprintLoad(source, fp_name)
+            except Exception:
+                continue
+            self._lib_hits[lib_nick] = source
+            return fp
 
         return None
 
@@ -181,28 +481,71 @@ class MultiBoardManager:
     Optimized for performance with caching and minimal I/O.
     """
 
+    # kicad-cli location, shared by every manager in this KiCad process: the
+    # dialog builds a new manager each time it opens, but the install doesn't
+    # move. See clear_kicad_cli_cache().
+    _kicad_cli: Optional[str] = None
+    _kicad_cli_searched = False
+    # Same for the KiCad share dir and its standard .pretty libraries
+    _kicad_share_found: Optional[Path] = None
+    _kicad_share_searched = False
+    _std_fp_libs: Optional[Dict[str, Path]] = None
+
     def __init__(self, project_dir: Path):
         self.project_dir = self._find_project_root(project_dir)
         self.config_path = self.project_dir / CONFIG_FILE
+        self.scan_cache_path = self.project_dir / SCAN_CACHE_FILE
         self.config = ProjectConfig()
 
         self.block_lib_path = self.project_dir / f"{BLOCK_LIB_NAME}.pretty"
         self.port_lib_path = self.project_dir / f"{PORT_LIB_NAME}.pretty"
         self.log_path = self.project_dir / DEBUG_LOG_NAME
+        self._log_file = None
+        self._log_lock = threading.Lock()
+        # Held for the whole of update_board / update_all_boards
+        self._update_lock = threading.Lock()
 
         # Caches
         self._fp_resolver = FootprintResolver()
+        self._libraries_loaded = False
         self._fp_lib_paths: Dict[str, Path] = {}
         self._kicad_share: Optional[Path] = None
-        self._kicad_cli: Optional[str] = None
+        self._executables: Dict[str, Optional[str]] = {}
+        self._pcb_paths: Dict[str, Path] = {}
+        self._resolved_paths: Dict[str, Path] = {}
+        self._block_signatures: Dict[str, tuple] = {}
+        self._registered_libs: Set[str] = set()
+        self._saved_config: Optional[bytes] = None
+        # Link kind that last worked for a schematic ("hard" or "sym")
+        self._link_mode: Optional[str] = None
 
         # Cached scan results (invalidated on update)
         self._scan_cache: Optional[Dict[str, Tuple[str, str]]] = None
+        # Per-PCB scan results: path -> ((mtime_ns, size), {ref: "lib:fp"}).
+        # Survives invalidate_caches(); the file fingerprint decides validity.
+        self._board_scans: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+        # _board_scans holds entries not yet written to SCAN_CACHE_FILE
+        self._scan_cache_dirty = False
+        # Last merged scan keyed by every board's (name, path, fingerprint)
+        self._merged_scan: Optional[Tuple[tuple, Dict[str, Tuple[str, str]]]] = None
+        # Inverse of the scan cache: board name -> refs placed on it
+        self._board_refs: Optional[Dict[str, Set[str]]] = None
         self._health_cache: Dict[str, dict] = {}
 
-        self._detect_root_files()
+        # Parsed netlist (components, nets) keyed by a schematic fingerprint
+        self._netlist_cache: Optional[Tuple[tuple, Tuple[Dict[str, dict], Dict[str, List[Tuple[str, str]]]]]] = None
+        # Placeable refs derived from a specific components dict (checked by identity)
+        self._included_refs: Optional[Tuple[Dict[str, dict], frozenset]] = None
+        # Sheet references per schematic file: path -> ((mtime_ns, size), matches)
+        self._sheet_refs: Dict[Path, Tuple[Tuple[int, int], List[str]]] = {}
+
+        # Load first so root-file detection runs once, on the config we keep
         self._load_config()
-        self._init_libraries()
+        self._load_scan_cache()
+        self._detect_root_files()
+        # Library tables are parsed on the first footprint load
+        # (_get_fp_resolver): opening the dialog or creating a board never
+        # needs them.
 
     # =========================================================================
     # Initialization
@@ -229,7 +572,7 @@ class MultiBoardManager:
 
         # Fall back to finding any .kicad_pro
         for path in [start] + list(start.parents):
-            if list(path.glob("*.kicad_pro")):
+            if any(_is_kicad_pro(name) for name in _list_dir_names(path)):
                 return path
 
         return start
@@ -237,37 +580,111 @@ class MultiBoardManager:
     def _log(self, message: str):
         """Write a timestamped message to the debug log."""
         try:
-            ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            with open(self.log_path, "a", encoding="utf-8") as f:
-                f.write(f"[{ts}] {message}\n")
+            # time.strftime skips building a datetime object per line
+            ts = time.strftime("%Y-%m-%d %H:%M:%S")
+            # The netlist export can log from a worker thread during an update
+            with self._log_lock:
+                # Opened on first use and kept for the manager's lifetime; an update
+                # can log hundreds of lines and reopening per line dominated.
+                # Line-buffered on purpose: a pcbnew SWIG call can take KiCad
+                # down, and the lines leading up to that are the useful ones.
+                if self._log_file is None:
+                    self._log_file = open(self.log_path, "a", encoding="utf-8", buffering=1)
+                self._log_file.write(f"[{ts}] {message}\n")
         except Exception:
             pass
 
+    def close(self):
+        """Release the debug log handle. Safe to call more than once."""
+        if self._log_file is not None:
+            try:
+                self._log_file.close()
+            except Exception:
+                pass
+            self._log_file = None
+
     def _detect_root_files(self):
         """Auto-detect the root schematic and PCB files."""
-        for pro_file in self.project_dir.glob("*.kicad_pro"):
-            sch = pro_file.with_suffix(".kicad_sch")
-            pcb = pro_file.with_suffix(".kicad_pcb")
-            if sch.exists():
-                self.config.root_schematic = sch.name
-            if pcb.exists():
-                self.config.root_pcb = pcb.name
-            break
+        # One directory listing answers both "which project" and "which
+        # siblings exist", instead of a glob plus a stat per sibling
+        names = _list_dir_names(self.project_dir)
+        for name in names:
+            if _is_kicad_pro(name):
+                stem = name[: -len(".kicad_pro")]
+                present = set(names)
+                if f"{stem}.kicad_sch" in present:
+                    self.config.root_schematic = f"{stem}.kicad_sch"
+                if f"{stem}.kicad_pcb" in present:
+                    self.config.root_pcb = f"{stem}.kicad_pcb"
+                break
 
     def _load_config(self):
         """Load the multiboard configuration from disk."""
         if self.config_path.exists():
             try:
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    self.config = ProjectConfig.from_dict(json.load(f))
-                self._detect_root_files()
+                data = _json_loads(self.config_path.read_bytes())
+                self.config = ProjectConfig.from_dict(data)
             except Exception as e:
                 self._log(f"Config load error: {e}")
 
     def save_config(self):
         """Save the multiboard configuration to disk."""
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(self.config.to_dict(), f, indent=2)
+        if orjson is not None:
+            # orjson walks the dataclasses natively, skipping the to_dict() copy.
+            # Their fields mirror to_dict() one-to-one, so the output is identical.
+            data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.config.to_dict(), indent=2).encode("utf-8")
+
+        # Handlers save after every edit; most of those leave the file unchanged
+        if data == self._saved_config and self.config_path.exists():
+            return
+
+        # Write-then-rename so a crash mid-write never leaves a truncated config
+        tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, self.config_path)
+        self._saved_config = data
+
+    def _load_scan_cache(self):
+        """
+        Seed the per-board scan results from the previous session.
+
+        Entries are still validated against each PCB's current mtime/size
+        before use, so a stale or foreign cache only costs a rescan.
+        """
+        try:
+            raw = self.scan_cache_path.read_bytes()
+        except OSError:
+            return
+        try:
+            data = _json_loads(raw)
+            for rel_path, (mtime_ns, size, refs) in data.items():
+                refs = {sys.intern(r): sys.intern(f) for r, f in refs.items()}
+                self._board_scans[str(self.project_dir / rel_path)] = ((mtime_ns, size), refs)
+        except Exception as e:
+            self._board_scans.clear()
+            self._log(f"Scan cache ignored: {e}")
+
+    def _save_scan_cache(self):
+        """Write the per-board scan results for the current boards to disk."""
+        self._scan_cache_dirty = False
+        data = {}
+        for board in self.config.boards.values():
+            entry = self._board_scans.get(str(self.get_pcb_path(board)))
+            if entry is not None:
+                data[board.pcb_path] = [entry[0][0], entry[0][1], entry[1]]
+        try:
+            if orjson is not None:
+                payload = orjson.dumps(data)
+            else:
+                payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+            # Write-then-rename, like the config: never leave a truncated cache
+            tmp_path = self.scan_cache_path.with_name(self.scan_cache_path.name + ".tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, self.scan_cache_path)
+        except Exception as e:
+            self._log(f"Scan cache save error: {e}")
 
     def _init_libraries(self):
         """Initialize footprint library paths."""
@@ -279,38 +696,88 @@ class MultiBoardManager:
         if proj_table.exists():
             self._parse_fp_lib_table(proj_table)
 
-        # Add KiCad standard libraries
+        # Add KiCad standard libraries (project entries take precedence)
         if self._kicad_share:
-            fp_dir = self._kicad_share / "footprints"
-            if fp_dir.exists():
-                for lib_path in fp_dir.iterdir():
-                    if lib_path.is_dir() and lib_path.suffix == ".pretty":
-                        if lib_path.stem not in self._fp_lib_paths:
-                            self._fp_lib_paths[lib_path.stem] = lib_path
+            for nick, lib_path in self._standard_fp_libs(self._kicad_share).items():
+                self._fp_lib_paths.setdefault(nick, lib_path)
 
         self._fp_resolver.set_lib_paths(self._fp_lib_paths, self._kicad_share)
         self._log(f"Initialized {len(self._fp_lib_paths)} footprint libraries")
+        self._libraries_loaded = True
+
+    def _get_fp_resolver(self) -> FootprintResolver:
+        """The footprint resolver, initializing library paths on first use."""
+        if not self._libraries_loaded:
+            self._init_libraries()
+        return self._fp_resolver
+
+    @classmethod
+    def _standard_fp_libs(cls, share: Path) -> Dict[str, Path]:
+        """
+        {nickname: path} for the .pretty folders shipped with KiCad.
+
+        Listed once per process; the library set only changes when KiCad is
+        reinstalled, which means a restart anyway.
+        """
+        if cls._std_fp_libs is None:
+            libs = {}
+            # Hundreds of .pretty folders: scandir gets the entry type from the
+            # directory read itself, so no per-library stat is needed.
+            try:
+                with os.scandir(share / "footprints") as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".pretty") and entry.is_dir():
+                            libs[entry.name[: -len(".pretty")]] = Path(entry.path)
+            except OSError:
+                pass
+            cls._std_fp_libs = libs
+        return cls._std_fp_libs
+
+    @classmethod
+    def _find_kicad_share(cls) -> Optional[Path]:
+        """Locate the KiCad shared data directory (searched once per process)."""
+        if not cls._kicad_share_searched:
+            cls._kicad_share_found = cls._search_kicad_share()
+            cls._kicad_share_searched = True
+        return cls._kicad_share_found
+
+    @staticmethod
+    def _search_kicad_share() -> Optional[Path]:
+        """Probe the usual install locations for KiCad's shared data."""
+        # KiCad exports KICAD<N>_FOOTPRINT_DIR (<share>/footprints) to plugins:
+        # when set it names the running install directly, including custom
+        # and Flatpak prefixes, and none of the default locations are probed.
+        suffix = "_FOOTPRINT_DIR"
+        versions = [name[5 : -len(suffix)] for name in os.environ if name.startswith("KICAD") and name.endswith(suffix)]
+        for ver in sorted(versions, key=_version_key, reverse=True):
+            fp_dir = os.environ[f"KICAD{ver}{suffix}"]
+            if os.path.basename(os.path.normpath(fp_dir)) == "footprints" and os.path.isdir(fp_dir):
+                return Path(fp_dir).parent
 
-    def _find_kicad_share(self) -> Optional[Path]:
-        """Locate the KiCad shared data directory."""
         if os.name == "nt":
             bases = [
                 Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / "KiCad",
                 Path(os.environ.get("ProgramFiles", "")) / "KiCad",
             ]
             for base in bases:
-                if base.exists():
-                    for ver in sorted(base.iterdir(), reverse=True):
-                        share = ver / "share" / "kicad"
-                        if (share / "footprints").exists():
-                            return share
+                # Same walk as _find_kicad_cli: one scandir instead of exists()
+                # + iterdir(), and newest version first ("10.0" after "9.0")
+                try:
+                    with os.scandir(base) as it:
+                        versions = sorted((e.name for e in it if e.is_dir()), key=_version_key, reverse=True)
+                except OSError:
+                    continue
+                for ver in versions:
+                    share = base / ver / "share" / "kicad"
+                    if os.path.isdir(share / "footprints"):
+                        return share
         else:
             for share in [
                 Path("/usr/share/kicad"),
                 Path("/usr/local/share/kicad"),
                 Path("/Applications/KiCad/KiCad.app/Contents/SharedSupport"),
             ]:
-                if (share / "footprints").exists():
+                if os.path.isdir(share / "footprints"):
                     return share
         return None
 
@@ -318,11 +785,11 @@ class MultiBoardManager:
         """Parse a KiCad footprint library table file."""
         try:
             content = path.read_text(encoding="utf-8", errors="ignore")
-            for match in RE_FP_LIB_ENTRY.finditer(content):
-                nick, uri = match.group(1), match.group(2)
-                expanded = uri.replace("${KIPRJMOD}", str(self.project_dir))
-                if "${" not in expanded:
-                    self._fp_lib_paths[nick] = Path(expanded)
+            project_dir = str(self.project_dir)
+            for nick, uri in _iter_lib_entries(content):
+                lib_path = _expand_lib_uri(uri, project_dir)
+                if lib_path is not None:
+                    self._fp_lib_paths[nick] = lib_path
         except Exception:
             pass
 
@@ -330,14 +797,22 @@ class MultiBoardManager:
     # KiCad CLI (cached)
     # =========================================================================
 
-    def _find_kicad_cli(self) -> Optional[str]:
-        """Find the kicad-cli executable."""
-        if self._kicad_cli:
-            return self._kicad_cli
+    @classmethod
+    def clear_kicad_cli_cache(cls):
+        """Forget the kicad-cli location so the next command searches again."""
+        cls._kicad_cli = None
+        cls._kicad_cli_searched = False
+
+    @classmethod
+    def _find_kicad_cli(cls) -> Optional[str]:
+        """Find the kicad-cli executable (searched once; misses are cached too)."""
+        if cls._kicad_cli_searched:
+            return cls._kicad_cli
+        cls._kicad_cli_searched = True
 
         exe = shutil.which("kicad-cli")
         if exe:
-            self._kicad_cli = exe
+            cls._kicad_cli = exe
             return exe
 
         if os.name == "nt":
@@ -346,25 +821,57 @@ class MultiBoardManager:
                 Path(os.environ.get("ProgramFiles", "")) / "KiCad",
             ]
             for base in bases:
-                if base.exists():
-                    for ver in sorted(base.iterdir(), reverse=True):
-                        cli = ver / "bin" / "kicad-cli.exe"
-                        if cli.exists():
-                            self._kicad_cli = str(cli)
-                            return self._kicad_cli
+                try:
+                    with os.scandir(base) as it:
+                        # DirEntry.is_dir() uses the listing's type info, no extra stat
+                        versions = sorted((e.name for e in it if e.is_dir()), key=_version_key, reverse=True)
+                except OSError:
+                    continue
+                for ver in versions:
+                    cli = base / ver / "bin" / "kicad-cli.exe"
+                    if cli.exists():
+                        cls._kicad_cli = str(cli)
+                        return cls._kicad_cli
         return None
 
+    def find_executable(self, name: str) -> Optional[str]:
+        """
+        Resolve a program on PATH, caching the result (including misses).
+
+        Used for the KiCad launchers (kicad/pcbnew) so repeated Open clicks
+        don't walk PATH each time.
+        """
+        if name not in self._executables:
+            self._executables[name] = shutil.which(name)
+        return self._executables[name]
+
     def _run_cli(self, args: List[str]) -> subprocess.CompletedProcess:
         """Run a kicad-cli command."""
         cli = self._find_kicad_cli()
         if not cli:
             raise FileNotFoundError("kicad-cli not found")
 
-        kwargs = {"capture_output": True, "text": True, "cwd": str(self.project_dir)}
+        # Results go to files (-o); stdout is progress chatter nobody reads, so
+        # don't buffer and decode it. stderr is kept for the debug log.
+        kwargs = {
+            "stdout": subprocess.DEVNULL,
+            "stderr": subprocess.PIPE,
+            "text": True,
+            "errors": "replace",
+            "cwd": str(self.project_dir),
+        }
         if os.name == "nt":
             kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
 
-        return subprocess.run([cli] + args, **kwargs)
+        try:
+            result = subprocess.run([cli] + args, **kwargs)
+        except FileNotFoundError:
+            # KiCad moved or was uninstalled since the lookup; search again next time
+            self.clear_kicad_cli_cache()
+            raise
+        if result.returncode != 0:
+            self._log(f"kicad-cli {' '.join(args[:3])} exited with {result.returncode}: {(result.stderr or '').strip()}")
+        return result
 
     # =========================================================================
     # Schematic Linking (Hardlink/Symlink Only - No Copies!)
@@ -380,7 +887,7 @@ class MultiBoardManager:
         Raises:
             SchematicLinkError: If linking fails (e.g., cross-device, permissions)
         """
-        pcb_path = self.project_dir / board.pcb_path
+        pcb_path = self.get_pcb_path(board)
         board_dir = pcb_path.parent
         base_name = pcb_path.stem
 
@@ -396,18 +903,31 @@ class MultiBoardManager:
             root_sch = self.project_dir / self.config.root_schematic
             if root_sch.exists():
                 self._link_file(root_sch, board_dir / f"{base_name}.kicad_sch")
-                for sheet_path in self._find_hierarchical_sheets(root_sch):
-                    source = (root_sch.parent / sheet_path).resolve()
+                # Mirror each sheet's place relative to the root schematic, so
+                # nested references (sub/a -> b means sub/b) resolve the same
+                # from the board folder
+                for source in self._find_hierarchical_sheets(root_sch):
                     if source.exists():
-                        self._link_file(source, board_dir / sheet_path)
+                        rel = os.path.relpath(source, root_sch.parent)
+                        self._link_file(source, Path(os.path.normpath(board_dir / rel)))
 
         # Copy library tables with resolved paths
+        prjmod = self.project_dir.as_posix().encode("utf-8")
         for table_name in ("fp-lib-table", "sym-lib-table"):
-            source = self.project_dir / table_name
-            if source.exists():
-                content = source.read_text(encoding="utf-8", errors="ignore")
-                content = content.replace("${KIPRJMOD}", self.project_dir.as_posix())
-                (board_dir / table_name).write_text(content, encoding="utf-8")
+            try:
+                content = (self.project_dir / table_name).read_bytes()
+            except OSError:
+                continue
+            content = content.replace(b"${KIPRJMOD}", prjmod)
+            # Tables rarely change between updates: only write when they did,
+            # so the board's copy keeps its mtime and KiCad has nothing to reload
+            dest = board_dir / table_name
+            try:
+                if dest.read_bytes() == content:
+                    continue
+            except OSError:
+                pass
+            dest.write_bytes(content)
 
     def _link_file(self, source: Path, dest: Path):
         """
@@ -419,27 +939,43 @@ class MultiBoardManager:
         Raises:
             SchematicLinkError: If neither hardlink nor symlink succeeds.
         """
-        dest.parent.mkdir(parents=True, exist_ok=True)
+        # Still linked (hardlink sharing the inode, or a symlink resolving to
+        # source): nothing to redo. Checked by identity, not existence: an
+        # editor that saves by writing a new file and renaming breaks a
+        # hardlink while leaving a stale copy behind at dest.
+        try:
+            if os.path.samefile(source, dest):
+                return
+        except OSError:
+            pass
 
-        # Remove existing file/link
-        if dest.exists() or dest.is_symlink():
-            dest.unlink()
+        dest.parent.mkdir(parents=True, exist_ok=True)
 
-        # Try hardlink first (preferred - same inode, instant sync)
+        # Remove existing file/link. Just try it: exists() + is_symlink()
+        # would cost two extra stats per sheet on every update.
         try:
-            os.link(str(source), str(dest))
-            self._log(f"Hardlinked: {source} -> {dest}")
-            return
-        except OSError as e:
-            self._log(f"Hardlink failed ({e}), trying symlink...")
+            dest.unlink()
+        except FileNotFoundError:
+            pass
 
-        # Try symlink (works cross-device, but needs admin on Windows)
-        try:
-            os.symlink(str(source), str(dest))
-            self._log(f"Symlinked: {source} -> {dest}")
-            return
-        except OSError as e:
-            self._log(f"Symlink failed: {e}")
+        # Hardlink is preferred (same inode, instant sync); symlink works
+        # cross-device but needs admin on Windows. Once hardlinks have failed
+        # and a symlink worked, later files go straight to the symlink instead
+        # of paying a failing os.link (plus its log line) per sheet. The other
+        # kind is still tried per file, e.g. for a sheet on another drive.
+        order = ("sym", "hard") if self._link_mode == "sym" else ("hard", "sym")
+        for mode in order:
+            try:
+                if mode == "hard":
+                    os.link(str(source), str(dest))
+                    self._log(f"Hardlinked: {source} -> {dest}")
+                else:
+                    os.symlink(str(source), str(dest))
+                    self._log(f"Symlinked: {source} -> {dest}")
+                self._link_mode = mode
+                return
+            except OSError as e:
+                self._log(f"{'Hardlink' if mode == 'hard' else 'Symlink'} failed: {e}")
 
         # INTENTIONALLY NO COPY FALLBACK
         # Copying would create multiple sources of truth and cause sync issues
@@ -457,29 +993,109 @@ class MultiBoardManager:
         )
 
     def _find_hierarchical_sheets(self, schematic: Path) -> Set[Path]:
-        """Find all hierarchical sheet references in a schematic."""
-        sheets, visited, stack = set(), set(), [schematic]
-        while stack:
-            current = stack.pop()
-            if current in visited:
-                continue
-            visited.add(current)
-            try:
-                content = current.read_text(encoding="utf-8", errors="ignore")
-                for match in RE_SHEET_REF.findall(content):
-                    sheet_path = Path(match)
-                    sheets.add(sheet_path)
-                    full_path = (current.parent / match).resolve()
-                    if full_path.exists():
-                        stack.append(full_path)
-            except Exception:
-                pass
+        """
+        Find all sheet files below a schematic, as normalized full paths.
+
+        Sheet names in a file are relative to *that* file's folder, so each is
+        joined to its referencing sheet, not to the root. Sheets that don't
+        exist are still returned (callers decide what a missing one means).
+
+        Walked one hierarchy level at a time so the sheets of a level, which
+        are independent files, can be read in parallel (only files changed
+        since the last walk are read at all).
+        """
+        sheets, level = set(), [schematic]
+        # Files are identified by (device, inode), so a sheet reached through
+        # two spellings or a symlinked folder is walked once and cycles end
+        root_st = _stat_or_none(schematic)
+        visited = {(root_st.st_dev, root_st.st_ino)} if root_st is not None else set()
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_SCANS) as pool:
+            while level:
+                results = pool.map(self._sheet_refs_in, level) if len(level) > 1 else [self._sheet_refs_in(level[0])]
+                next_level = []
+                for current, matches in zip(level, results):
+                    for match in matches:
+                        # Lexical join: resolve() would readlink/stat every
+                        # path component, for every sheet reference
+                        full_path = Path(os.path.normpath(current.parent / match))
+                        st = _stat_or_none(full_path)
+                        if st is None:
+                            sheets.add(full_path)
+                            continue
+                        key = (st.st_dev, st.st_ino)
+                        if key not in visited:
+                            visited.add(key)
+                            sheets.add(full_path)
+                            next_level.append(full_path)
+                level = next_level
         return sheets
 
+    def _sheet_refs_in(self, schematic: Path) -> List[str]:
+        """
+        Sheet file names referenced by one schematic ([] if unreadable).
+
+        The fingerprint walks the hierarchy on every netlist lookup, so the
+        matches are kept per file and only re-read when its mtime/size change.
+        """
+        try:
+            st = os.stat(schematic)
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self._sheet_refs.get(schematic)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+            content = schematic.read_bytes()
+        except OSError:
+            return []
+        # The pattern is ASCII: match on the raw bytes and decode only the
+        # captured names, not the whole (often multi-MB) schematic. A sheet
+        # file instantiated N times (and its Sheetfile property) shows up N+
+        # times: dedupe, in order, before the caller joins and stats each one.
+        matches = [m.decode("utf-8", "ignore") for m in dict.fromkeys(RE_SHEET_REF.findall(content))]
+        self._sheet_refs[schematic] = (key, matches)
+        return matches
+
     # =========================================================================
     # Board Management
     # =========================================================================
 
+    def get_pcb_path(self, board: BoardConfig) -> Path:
+        """
+        Absolute PCB path for a board.
+
+        Memoized on the relative path string, so renaming/re-pathing a board
+        naturally misses the cache and no invalidation is needed.
+        """
+        path = self._pcb_paths.get(board.pcb_path)
+        if path is None:
+            path = self._pcb_paths[board.pcb_path] = self.project_dir / board.pcb_path
+        return path
+
+    def resolve_path(self, path) -> Path:
+        """
+        Path.resolve() memoized on the input string.
+
+        Resolving hits the filesystem for every component, and open-board
+        checks compare the same handful of paths on every refresh.
+        """
+        key = str(path)
+        resolved = self._resolved_paths.get(key)
+        if resolved is None:
+            try:
+                resolved = Path(key).resolve()
+            except (OSError, RuntimeError):
+                resolved = Path(key)
+            self._resolved_paths[key] = resolved
+        return resolved
+
+    def get_active_board_path(self) -> Optional[Path]:
+        """Resolved path of the board open in this pcbnew instance, if any."""
+        try:
+            b = pcbnew.GetBoard()
+            open_file = b.GetFileName() if b else ""
+        except Exception:
+            return None
+        return self.resolve_path(open_file) if open_file else None
+
     def create_board(self, name: str, description: str = "") -> Tuple[bool, str]:
         """
         Create a new sub-board.
@@ -490,7 +1106,7 @@ class MultiBoardManager:
         if name in self.config.boards:
             return False, f"Board '{name}' already exists"
 
-        safe_name = "".join(c if c.isalnum() or c in "_-" else "_" for c in name)
+        safe_name = RE_UNSAFE_NAME_CHAR.sub("_", name)
         rel_path = f"{BOARDS_DIR}/{safe_name}/{safe_name}.kicad_pcb"
         pcb_path = self.project_dir / rel_path
 
@@ -518,38 +1134,33 @@ class MultiBoardManager:
 
         self.config.boards[name] = board
         self.save_config()
-        self._scan_cache = None  # Invalidate cache
+        self.invalidate_caches()
 
         return True, rel_path
 
     def _create_empty_pcb(self, path: Path):
         """Create an empty KiCad PCB file."""
-        pcb_content = '''(kicad_pcb
-  (version 20240108) (generator "multiboard") (generator_version "9.0")
-  (general (thickness 1.6) (legacy_teardrops no)) (paper "A4")
-  (layers
-    (0 "F.Cu" signal) (31 "B.Cu" signal)
-    (36 "B.SilkS" user) (37 "F.SilkS" user)
-    (38 "B.Mask" user) (39 "F.Mask" user)
-    (44 "Edge.Cuts" user) (47 "F.CrtYd" user) (49 "F.Fab" user))
-  (setup (pad_to_mask_clearance 0)) (net 0 ""))
-'''
-        path.write_text(pcb_content, encoding="utf-8")
+        path.write_bytes(_EMPTY_PCB)
 
     def _ensure_lib_in_table(self, lib_name: str, rel_path: str):
         """Ensure a library is registered in the project fp-lib-table."""
+        # Once confirmed, a library stays registered for this session
+        if lib_name in self._registered_libs:
+            return
         table_path = self.project_dir / "fp-lib-table"
         entry = f'  (lib (name "{lib_name}")(type "KiCad")(uri "${{KIPRJMOD}}/{rel_path}")(options "")(descr ""))'
 
         if table_path.exists():
             content = table_path.read_text(encoding="utf-8", errors="ignore")
             if lib_name in content:
+                self._registered_libs.add(lib_name)
                 return
             content = content.rstrip().rstrip(")") + f"\n{entry}\n)"
         else:
             content = f"(fp_lib_table\n  (version 7)\n{entry}\n)"
 
-        table_path.write_text(content, encoding="utf-8")
+        table_path.write_bytes(content.encode("utf-8"))
+        self._registered_libs.add(lib_name)
 
     # =========================================================================
     # Block Footprints
@@ -557,9 +1168,19 @@ class MultiBoardManager:
 
     def _generate_block_footprint(self, board: BoardConfig):
         """Generate a visually appealing block footprint with correct KiCad 9 syntax."""
-        self.block_lib_path.mkdir(parents=True, exist_ok=True)
-
         fp_name = f"Block_{board.name}"
+        fp_path = self.block_lib_path / f"{fp_name}.kicad_mod"
+
+        # Skip regeneration when nothing that shapes the footprint has changed
+        signature = (
+            board.block_width,
+            board.block_height,
+            tuple((p.name, p.net, p.side, p.position) for p in board.ports.values()),
+        )
+        if self._block_signatures.get(board.name) == signature and fp_path.exists():
+            return
+
+        self.block_lib_path.mkdir(parents=True, exist_ok=True)
         w, h = board.block_width, board.block_height
         hw, hh = w / 2, h / 2
 
@@ -705,7 +1326,7 @@ class MultiBoardManager:
             lines.append("    (effects (font (size 1 1) (thickness 0.15)))")
             lines.append("  )")
 
-            net_name = getattr(port, "net", "") or ""
+            net_name = port.net
             if net_name and net_name != port_name:
                 lines.append(
                     f'  (fp_text user "{net_name}" (at {label_x:.3f} {label_y + 1.4:.3f} {label_rot}) (layer "F.Fab")'
@@ -715,8 +1336,10 @@ class MultiBoardManager:
 
         lines.append(")")
 
-        fp_path = self.block_lib_path / f"{fp_name}.kicad_mod"
-        fp_path.write_text("\n".join(lines), encoding="utf-8")
+        # Encoded once and written as-is: no text-layer newline translation,
+        # so the file is byte-identical on every platform
+        fp_path.write_bytes("\n".join(lines).encode("utf-8"))
+        self._block_signatures[board.name] = signature
 
     def _calculate_port_position(self, port: PortDef, w: float, h: float) -> Tuple[float, float]:
         """Calculate the X,Y position of a port on the block footprint."""
@@ -763,7 +1386,7 @@ class MultiBoardManager:
             ")",
         ]
 
-        (self.port_lib_path / f"Port_{port_name}.kicad_mod").write_text("\n".join(lines), encoding="utf-8")
+        (self.port_lib_path / f"Port_{port_name}.kicad_mod").write_bytes("\n".join(lines).encode("utf-8"))
         self._ensure_lib_in_table(PORT_LIB_NAME, f"{PORT_LIB_NAME}.pretty")
 
     # =========================================================================
@@ -776,37 +1399,162 @@ class MultiBoardManager:
 
         Returns: {ref: (board_name, footprint_id)}
 
-        Results are cached until invalidated.
+        Every call stats each PCB, so a board saved in KiCad since the last
+        scan is always picked up; unchanged boards (same mtime and size) are
+        not re-read. force=True re-reads every board regardless.
         """
-        if not force and self._scan_cache is not None:
+        # First pass: reuse unchanged boards and collect the rest for scanning.
+        # No shortcut on _scan_cache: update_board decides what is "placed
+        # elsewhere" from this map, so it must never be older than the files.
+        boards = []
+        stale = []
+        key = []
+        for name, board in self.config.boards.items():
+            pcb_path = self.get_pcb_path(board)
+            st = _stat_or_none(pcb_path)
+            if st is None:
+                continue
+            fingerprint = (st.st_mtime_ns, st.st_size)
+            key.append((name, str(pcb_path), fingerprint))
+            cached = None if force else self._board_scans.get(str(pcb_path))
+            if cached is not None and cached[0] == fingerprint:
+                boards.append((name, cached[1]))
+            else:
+                boards.append((name, None))
+                stale.append((name, pcb_path, fingerprint))
+
+        # Nothing changed on disk since the last merge: hand back that result
+        # without rebuilding the ref map (the common case on a UI refresh).
+        key = tuple(key)
+        if not stale and self._merged_scan is not None and self._merged_scan[0] == key:
+            self._scan_cache = self._merged_scan[1]
             return self._scan_cache
 
+        # The text scan is pure Python file I/O, so it can run in threads.
+        # pcbnew is not thread-safe: the LoadBoard fallback stays on this one.
+        if len(stale) > 1:
+            workers = min(MAX_PARALLEL_SCANS, len(stale))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_scan_pcb_refs, [s[1] for s in stale]))
+        else:
+            results = [_scan_pcb_refs(s[1]) for s in stale]
+
+        scanned = {}
+        for (name, pcb_path, fingerprint), refs in zip(stale, results):
+            if refs is None:
+                refs = self._scan_pcb_refs_with_pcbnew(name, pcb_path)
+                if refs is None:
+                    continue
+            self._board_scans[str(pcb_path)] = (fingerprint, refs)
+            scanned[name] = refs
+        if stale:
+            self._save_scan_cache()
+
+        # Merge in config order so a duplicated reference still resolves to
+        # the same board as a sequential scan would pick.
         placed = {}
-        for name, board in self.config.boards.items():
-            pcb_path = self.project_dir / board.pcb_path
-            if not pcb_path.exists():
-                continue
-            try:
-                pcb = pcbnew.LoadBoard(str(pcb_path))
-                for fp in pcb.GetFootprints():
-                    ref = fp.GetReference()
-                    if ref and not ref.startswith("#") and not ref.startswith("MB_"):
-                        fpid = fp.GetFPID()
-                        fp_str = f"{fpid.GetLibNickname()}:{fpid.GetLibItemName()}"
-                        placed[ref] = (name, fp_str)
-            except Exception as e:
-                self._log(f"Scan error {name}: {e}")
+        for name, refs in boards:
+            if refs is None:
+                refs = scanned.get(name)
+                if refs is None:
+                    continue
+            for ref, fp_str in refs.items():
+                placed[ref] = (name, fp_str)
 
         self._scan_cache = placed
+        self._merged_scan = (key, placed)
+        self._board_refs = None
         return placed
 
+    def _scan_pcb_refs_with_pcbnew(self, name: str, pcb_path: Path) -> Optional[Dict[str, str]]:
+        """Slow but exact scan through LoadBoard, for files the text scan can't read."""
+        try:
+            refs = {}
+            pcb = pcbnew.LoadBoard(str(pcb_path))
+            for fp in pcb.GetFootprints():
+                ref = fp.GetReference()
+                if ref and not ref.startswith(_SKIP_REF_PREFIXES):
+                    fpid = fp.GetFPID()
+                    refs[ref] = sys.intern(f"{fpid.GetLibNickname()}:{fpid.GetLibItemName()}")
+            return refs
+        except Exception as e:
+            self._log(f"Scan error {name}: {e}")
+            return None
+
+    def get_board_refs(self, board_name: str) -> Set[str]:
+        """
+        Refs placed on one board, from an index built once per scan.
+
+        Saves walking every placed component whenever a view needs just
+        one board's contents.
+        """
+        return self._board_ref_index().get(board_name, set())
+
+    def get_component_counts(self) -> Dict[str, int]:
+        """
+        {board name: placed component count}.
+
+        Read off the board -> refs index, which _patch_scan_cache keeps in
+        sync after an update, so a grid refresh doesn't re-tally every ref.
+        """
+        return {board: len(refs) for board, refs in self._board_ref_index().items()}
+
+    def _board_ref_index(self) -> Dict[str, Set[str]]:
+        """board name -> refs placed on it, built once per scan."""
+        placed = self.scan_all_boards()
+        if self._board_refs is None:
+            index: Dict[str, Set[str]] = {}
+            for ref, (board, _) in placed.items():
+                index.setdefault(board, set()).add(ref)
+            self._board_refs = index
+        return self._board_refs
+
+    def invalidate_caches(self):
+        """
+        Drop cached scan and health results.
+
+        Call after anything that changes which components live on which
+        board (create/remove/update). The per-file scans (_board_scans) are
+        kept: scan_all_boards re-validates them by mtime/size on every call,
+        and scan_all_boards(force=True) re-reads them all.
+        """
+        self._scan_cache = None
+        self._merged_scan = None
+        self._board_refs = None
+        self._health_cache.clear()
+
+    def _patch_scan_cache(self, board_name: str, fp_ids: Dict[str, str]):
+        """Replace one board's entries in the scan cache with {ref: "lib:fp"}."""
+        cache = self._scan_cache
+        if cache is None:
+            return
+        index = self._board_refs
+        if index is not None:
+            old_refs = index.pop(board_name, set())
+        else:
+            old_refs = [r for r, (b, _) in cache.items() if b == board_name]
+        for ref in old_refs:
+            del cache[ref]
+
+        new_refs = set()
+        for ref, fp_str in fp_ids.items():
+            if ref and not ref.startswith(_SKIP_REF_PREFIXES):
+                prev = cache.get(ref)
+                if prev is not None and index is not None:
+                    # Same ref also on another board: the last board wins, as in a scan
+                    index.get(prev[0], set()).discard(ref)
+                cache[ref] = (board_name, fp_str)
+                new_refs.add(ref)
+        if index is not None:
+            index[board_name] = new_refs
+
     def get_board_nets(self, board_name: str) -> Dict[str, Set[str]]:
         """Get all nets used in a board, mapped to their connected pins."""
         board = self.config.boards.get(board_name)
         if not board:
             return {}
 
-        pcb_path = self.project_dir / board.pcb_path
+        pcb_path = self.get_pcb_path(board)
         if not pcb_path.exists():
             return {}
 
@@ -836,7 +1584,7 @@ class MultiBoardManager:
             if progress_callback:
                 progress_callback(int(100 * i / max(total, 1)), f"Checking {name}...")
 
-            pcb_path = self.project_dir / board.pcb_path
+            pcb_path = self.get_pcb_path(board)
             if not pcb_path.exists():
                 report["errors"].append(f"{name}: PCB not found")
                 continue
@@ -846,7 +1594,7 @@ class MultiBoardManager:
                 self._run_cli(["pcb", "drc", "--format", "json", "-o", str(drc_file), str(pcb_path)])
 
                 if drc_file.exists():
-                    drc = json.loads(drc_file.read_text(encoding="utf-8"))
+                    drc = _json_loads(drc_file.read_bytes())
                     violations = drc.get("violations", [])
 
                     port_nets = {p.net for p in board.ports.values() if p.net}
@@ -872,6 +1620,7 @@ class MultiBoardManager:
     # Board Update
     # =========================================================================
 
+    @_exclusive_update
     def update_board(self, board_name: str, progress_callback=None) -> Tuple[bool, str]:
         """
         Update a board from schematic - optimized for speed.
@@ -883,7 +1632,7 @@ class MultiBoardManager:
         if not board:
             return False, f"Board '{board_name}' not found"
 
-        pcb_path = self.project_dir / board.pcb_path
+        pcb_path = self.get_pcb_path(board)
         if not pcb_path.exists():
             return False, f"PCB not found: {board.pcb_path}"
 
@@ -909,32 +1658,59 @@ class MultiBoardManager:
             #   7) Add missing footprints and drop them in a grid near origin
             #   8) Assign nets from the netlist
             #   9) Save PCB
+            #
+            # Steps 3+4 are the exception: kicad-cli and the XML parse never
+            # touch pcbnew, so they run in a worker while steps 1-2 happen here.
 
-            # Step 1: Setup
-            if progress_callback:
-                progress_callback(2, "Refreshing schematic links...")
-            try:
-                self._setup_board_project(board)
-            except SchematicLinkError as e:
-                return False, str(e)
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                # Step 3+4: Export netlist and parse components + nets in one pass.
+                # Reuses the cached parse when no schematic file changed since
+                # the last export (e.g. the Status dialog just loaded it).
+                netlist_future = pool.submit(self._load_netlist)
 
-            # Step 2: Scan existing boards (use cache if valid)
-            if progress_callback:
-                progress_callback(5, "Scanning boards...")
-            placed = self.scan_all_boards()
-
-            # Step 3: Export netlist
-            if progress_callback:
-                progress_callback(10, "Exporting netlist...")
-            netlist_path = self._export_netlist()
-            if not netlist_path:
+                try:
+                    # Step 1: Setup
+                    if progress_callback:
+                        progress_callback(2, "Refreshing schematic links...")
+                    self._setup_board_project(board)
+
+                    # Step 2: Scan existing boards (use cache if valid)
+                    if progress_callback:
+                        progress_callback(5, "Scanning boards...")
+                    placed = self.scan_all_boards()
+                except BaseException:
+                    self._drain(netlist_future, progress_callback)
+                    raise
+
+                netlist = self._wait_for(netlist_future, progress_callback, 10, "Exporting netlist...")
+            if netlist is None:
                 return False, "Failed to export netlist"
+            components, nets = netlist
+        except SchematicLinkError as e:
+            return False, str(e)
+        except Exception as e:
+            self._log(f"Update error: {e}\n{traceback.format_exc()}")
+            return False, f"Error: {e}"
 
-            # Step 4: Fast netlist parsing
-            if progress_callback:
-                progress_callback(20, "Parsing netlist...")
-            components = self._parse_netlist_optimized(netlist_path)
+        return self._sync_board(board, pcb_path, dict(placed), components, nets, progress_callback)
+
+    def _sync_board(
+        self,
+        board: BoardConfig,
+        pcb_path: Path,
+        placed: Dict[str, Tuple[str, str]],
+        components: Dict[str, dict],
+        nets: Dict[str, List[Tuple[str, str]]],
+        progress_callback=None,
+    ) -> Tuple[bool, str]:
+        """
+        Steps 5-10 of update_board against an already parsed netlist.
 
+        ``placed`` is updated in place with the refs added to this board, so
+        update_all_boards can carry it from one board to the next.
+        """
+        board_name = board.name
+        try:
             # Step 5: Load PCB
             if progress_callback:
                 progress_callback(25, "Loading PCB...")
@@ -942,15 +1718,23 @@ class MultiBoardManager:
             if not pcb:
                 return False, "Failed to load PCB"
 
-            # Build existing footprint map
+            resolver = self._get_fp_resolver()
+
+            # Build existing footprint maps in one pass over the board, so the
+            # loops below work on plain dicts instead of calling into SWIG
             existing = {}
             existing_fp = {}
+            # Schematic path ("/<tstamp>") -> ref, to follow re-annotated symbols
+            existing_path = {}
             for fp in pcb.GetFootprints():
                 ref = fp.GetReference()
                 if ref:
                     existing[ref] = fp
                     fpid = fp.GetFPID()
                     existing_fp[ref] = f"{fpid.GetLibNickname()}:{fpid.GetLibItemName()}"
+                    path = fp.GetPath().AsString()
+                    if path:
+                        existing_path[path] = ref
 
             # Filter components for this board
             to_add = []
@@ -968,6 +1752,23 @@ class MultiBoardManager:
 
                 if ref in existing:
                     to_update.append((ref, info))
+                    continue
+
+                # Not here under this ref, but the same symbol may be: a
+                # re-annotated part (R1 -> R5) keeps its tstamp. Rename the
+                # placed footprint instead of adding a duplicate next to an
+                # orphan. Only if the old ref is gone from the netlist.
+                path = f"/{info['tstamp']}"
+                old_ref = existing_path.get(path) if info["tstamp"] else None
+                if old_ref is not None and old_ref in existing and old_ref not in components:
+                    fp = existing.pop(old_ref)
+                    fp.SetReference(ref)
+                    existing_path[path] = ref
+                    existing[ref] = fp
+                    existing_fp[ref] = existing_fp.pop(old_ref)
+                    placed.pop(old_ref, None)
+                    placed[ref] = (board_name, existing_fp[ref])
+                    to_update.append((ref, info))
                 else:
                     to_add.append((ref, info))
 
@@ -982,7 +1783,7 @@ class MultiBoardManager:
 
                 if old_fp_id != info["footprint"]:
                     lib, name = self._split_fpid(info["footprint"])
-                    new_fp = self._fp_resolver.load(lib, name)
+                    new_fp = resolver.load(lib, name)
                     if new_fp:
                         pos, rot, layer = fp.GetPosition(), fp.GetOrientationDegrees(), fp.GetLayer()
                         pcb.Remove(fp)
@@ -994,13 +1795,16 @@ class MultiBoardManager:
                         self._set_fp_path(new_fp, info["tstamp"])
                         pcb.Add(new_fp)
                         existing[ref] = new_fp
+                        existing_fp[ref] = info["footprint"]
                         replaced += 1
                     else:
                         fp.SetValue(info["value"])
                         updated += 1
                 else:
                     fp.SetValue(info["value"])
-                    self._set_fp_path(fp, info["tstamp"])
+                    # Usually already linked to its symbol; skip the KIID_PATH round-trip
+                    if existing_path.get(f"/{info['tstamp']}") != ref:
+                        self._set_fp_path(fp, info["tstamp"])
                     updated += 1
 
             # Step 7: Add new components
@@ -1019,11 +1823,13 @@ class MultiBoardManager:
                     progress_callback(pct, f"Adding components ({i+1}/{total_to_add})...")
 
                 lib, name = self._split_fpid(info["footprint"])
-                fp = self._fp_resolver.load(lib, name)
+                fp = resolver.load(lib, name)
 
                 if not fp:
                     failed += 1
-                    failed_list.append(f"{ref}: {info['footprint']}")
+                    # Only the first few end up in the summary dialog
+                    if len(failed_list) < MAX_FAILED_IN_SUMMARY:
+                        failed_list.append(f"{ref}: {info['footprint']}")
                     continue
 
                 fp.SetReference(ref)
@@ -1031,7 +1837,9 @@ class MultiBoardManager:
                 self._set_fp_path(fp, info["tstamp"])
                 pcb.Add(fp)
                 existing[ref] = fp
+                existing_fp[ref] = info["footprint"]
                 new_footprints.append(fp)
+                placed[ref] = (board_name, info["footprint"])
                 added += 1
 
             # Step 8: Pack new components
@@ -1044,20 +1852,24 @@ class MultiBoardManager:
             # Step 9: Assign nets
             if progress_callback:
                 progress_callback(85, "Assigning nets...")
-            self._assign_nets_optimized(pcb, netlist_path, existing)
+            self._assign_nets_optimized(pcb, nets, existing)
 
             # Step 10: Save
             if progress_callback:
                 progress_callback(95, "Saving...")
             pcbnew.SaveBoard(str(pcb_path), pcb)
 
-            # Cleanup
-            try:
-                netlist_path.unlink()
-            except Exception:
-                pass
-
-            self._scan_cache = None  # Invalidate cache
+            # The board we just saved is still in memory: patch its entries in
+            # the scan cache instead of forcing a LoadBoard of every PCB
+            self._patch_scan_cache(board_name, existing_fp)
+            st = _stat_or_none(pcb_path)
+            if st is not None:
+                self._board_scans[str(pcb_path)] = (
+                    (st.st_mtime_ns, st.st_size),
+                    {r: f for r, f in existing_fp.items() if r and not r.startswith(_SKIP_REF_PREFIXES)},
+                )
+                self._save_scan_cache()
+            self._health_cache.pop(board_name, None)
 
             msg = f"Added: {added}\nUpdated: {updated}"
             if replaced:
@@ -1065,7 +1877,9 @@ class MultiBoardManager:
             if failed:
                 msg += f"\nFailed: {failed}"
                 if failed_list:
-                    msg += "\n\n" + "\n".join(failed_list[:10])
+                    msg += "\n\n" + "\n".join(failed_list)
+                    if failed > len(failed_list):
+                        msg += f"\n... and {failed - len(failed_list)} more"
 
             return True, msg
 
@@ -1073,6 +1887,100 @@ class MultiBoardManager:
             self._log(f"Update error: {e}\n{traceback.format_exc()}")
             return False, f"Error: {e}"
 
+    @_exclusive_update
+    def update_all_boards(self, progress_callback=None) -> Tuple[bool, str]:
+        """
+        Update every board from one netlist export and one placement scan.
+
+        Boards are processed one after another: pcbnew is not thread-safe,
+        so the win comes from sharing the kicad-cli export and the scan
+        rather than from running boards concurrently. The result matches
+        pressing Update on each board in order; unplaced components land on
+        the first board that is updated.
+        """
+        names = list(self.config.boards)
+        if not names:
+            return False, "No boards to update"
+
+        # Export in a worker (kicad-cli + XML only) while the boards are scanned
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            netlist_future = pool.submit(self._load_netlist)
+            if progress_callback:
+                progress_callback(2, "Scanning boards...")
+            try:
+                placed = dict(self.scan_all_boards())
+            except BaseException:
+                self._drain(netlist_future, progress_callback)
+                raise
+            netlist = self._wait_for(netlist_future, progress_callback, 8, "Exporting netlist...")
+        if netlist is None:
+            return False, "Failed to export netlist"
+        components, nets = netlist
+
+        results = []
+        all_ok = True
+        for i, name in enumerate(names):
+            if progress_callback:
+                progress_callback(10 + int(85 * i / len(names)), f"Updating {name} ({i + 1}/{len(names)})...")
+
+            board = self.config.boards[name]
+            pcb_path = self.get_pcb_path(board)
+            if not pcb_path.exists():
+                ok, msg = False, f"PCB not found: {board.pcb_path}"
+            elif self.is_pcb_open(pcb_path):
+                ok, msg = False, "Open in KiCad, skipped"
+            else:
+                try:
+                    self._setup_board_project(board)
+                    ok, msg = self._sync_board(board, pcb_path, placed, components, nets)
+                except SchematicLinkError as e:
+                    ok, msg = False, str(e)
+                except Exception as e:
+                    # Earlier boards are already saved: report this one and
+                    # carry on, so every board gets a result line
+                    self._log(f"Update error {name}: {e}\n{traceback.format_exc()}")
+                    ok, msg = False, f"Error: {e}"
+
+            all_ok = all_ok and ok
+            results.append(f"[{name}]\n{msg}")
+
+        if progress_callback:
+            progress_callback(100, "Complete")
+        return all_ok, "\n\n".join(results)
+
+    @staticmethod
+    def _wait_for(future, progress_callback, percent: int, message: str):
+        """
+        future.result(), reporting progress while it runs.
+
+        The dialogs' progress callbacks pump the wx event loop, so polling
+        here keeps the UI painting during a long kicad-cli export instead
+        of blocking the GUI thread in a single wait.
+        """
+        if progress_callback is None:
+            return future.result()
+        while True:
+            progress_callback(percent, message)
+            try:
+                return future.result(timeout=0.1)
+            except FutureTimeout:
+                continue
+
+    @classmethod
+    def _drain(cls, future, progress_callback):
+        """
+        Settle an export future on an error path, keeping the UI pumped.
+
+        Leaving the executor block would otherwise block the GUI thread in
+        shutdown() until kicad-cli finishes. The result is not needed.
+        """
+        if future.cancel():
+            return
+        try:
+            cls._wait_for(future, progress_callback, 10, "Finishing netlist export...")
+        except Exception:
+            pass
+
     def _export_netlist(self) -> Optional[Path]:
         """Export a netlist from the root schematic using kicad-cli."""
         if not self.config.root_schematic:
@@ -1088,36 +1996,112 @@ class MultiBoardManager:
         except Exception:
             return None
 
-    def _parse_netlist_optimized(self, path: Path) -> Dict[str, dict]:
+    def _schematic_fingerprint(self) -> Optional[tuple]:
+        """
+        (path, mtime_ns, size) for the root schematic and its sheets.
+
+        The netlist is a pure function of these files, so an unchanged
+        fingerprint means a previous export+parse can be reused.
+        """
+        if not self.config.root_schematic:
+            return None
+        root_sch = self.project_dir / self.config.root_schematic
+        entries = []
+        for path in [root_sch] + sorted(self._find_hierarchical_sheets(root_sch)):
+            try:
+                st = os.stat(path)
+            except OSError:
+                if path == root_sch:
+                    return None
+                # Kept as "missing": the netlist changes when the sheet appears
+                entries.append((str(path), -1, -1))
+                continue
+            entries.append((str(path), st.st_mtime_ns, st.st_size))
+        return tuple(entries)
+
+    def _load_netlist(self, force: bool = False) -> Optional[Tuple[Dict[str, dict], Dict[str, List[Tuple[str, str]]]]]:
+        """
+        Parsed (components, nets) for the root schematic, or None on failure.
+
+        Exporting runs kicad-cli (hundreds of ms to seconds), so the parse is
+        reused until the schematic or one of its sheets changes on disk.
+        force=True always re-exports (and refreshes the cache).
+        """
+        fingerprint = self._schematic_fingerprint()
+        if not force and fingerprint is not None and self._netlist_cache and self._netlist_cache[0] == fingerprint:
+            return self._netlist_cache[1]
+
+        path = self._export_netlist()
+        if not path:
+            return None
+        try:
+            netlist = self._parse_netlist_optimized(path)
+        finally:
+            try:
+                path.unlink()
+            except Exception:
+                pass
+        if fingerprint is not None:
+            self._netlist_cache = (fingerprint, netlist)
+        return netlist
+
+    def _included_refs_of(self, comps: Optional[Dict[str, dict]]) -> Optional[frozenset]:
+        """
+        Refs that belong on a board (not DNP / excluded / footprint-less).
+
+        Derived once per parsed components dict instead of on every status query.
+        """
+        if comps is None:
+            return None
+        cached = self._included_refs
+        if cached is None or cached[0] is not comps:
+            cached = self._included_refs = (comps, frozenset(r for r, i in comps.items() if not i["skip"]))
+        return cached[1]
+
+    def _parse_netlist_optimized(self, path: Path) -> Tuple[Dict[str, dict], Dict[str, List[Tuple[str, str]]]]:
         """
         Optimized netlist parsing with correct Exclude From Board detection.
 
+        Returns (components, nets) from a single streaming pass, where nets
+        maps each net name to its (ref, pin) nodes.
+
         KiCad exports "Exclude from board" as a property where:
         - Name can be: "exclude_from_board", "Exclude from board", "ki_exclude_from_board"
         - Value "1", "yes", "true" means exclude
         - EMPTY VALUE "" also means TRUE (KiCad boolean property quirk)
         """
         components = {}
+        nets: Dict[str, List[Tuple[str, str]]] = {}
+        excluded: List[str] = []
+
+        # Stream the file: each <comp>/<net> is dropped once read and unused
+        # sections once they close, so memory stays flat. lxml (3-5x faster)
+        # filters on the tag in C; stdlib needs a Python check.
+        if _HAS_LXML:
+            # kicad-cli pretty-prints the netlist; remove_blank_text keeps libxml2
+            # from building an indentation string for every element's tail
+            parser = _xml.iterparse(
+                str(path), events=("end",), tag=("comp", "net", *_DISCARD_NETLIST_TAGS), remove_blank_text=True
+            )
+        else:
+            parser = _xml.iterparse(str(path), events=("end",))
 
-        # Try to use lxml if available (3-5x faster)
-        try:
-            from lxml import etree
-
-            tree = etree.parse(str(path))
-            root = tree.getroot()
-            comp_elements = root.iter("comp")
-            use_lxml = True
-        except ImportError:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(str(path))
-            root = tree.getroot()
-            comp_elements = root.iter("comp")
-            use_lxml = False
-
-        for elem in comp_elements:
+        for _, elem in parser:
+            tag = elem.tag
+            if tag in _DISCARD_NETLIST_TAGS:
+                _release(elem)
+                continue
+            if tag == "net":
+                net_name = elem.get("name", "")
+                if net_name:
+                    nets[net_name] = [(node.get("ref", ""), node.get("pin", "")) for node in _net_nodes(elem)]
+                _release(elem)
+                continue
+            if tag != "comp":
+                continue
             ref = elem.get("ref", "")
             if not ref or ref.startswith("#"):
+                _release(elem)
                 continue
 
             footprint = ""
@@ -1128,47 +2112,45 @@ class MultiBoardManager:
             for child in elem:
                 tag = child.tag
                 if tag == "footprint":
-                    footprint = (child.text or "").strip()
+                    # Interned: a handful of footprints/values repeat across
+                    # thousands of components, and equal ids then compare by identity
+                    footprint = sys.intern((child.text or "").strip())
                 elif tag == "value":
-                    value = (child.text or "").strip()
+                    value = sys.intern((child.text or "").strip())
                 elif tag == "tstamp":
                     tstamp = (child.text or "").strip()
+                elif skip:
+                    # Already excluded: further properties/fields can't change that
+                    continue
                 elif tag == "property":
-                    pname = (child.get("name") or "").strip()
+                    kind = _classify_prop(child.get("name") or "")
+                    if not kind:
+                        # Most properties (Sheetname, Datasheet, ...) don't matter here
+                        continue
                     pval = (child.get("value") or "").strip()
-
-                    # Normalize property name for comparison
-                    pname_normalized = pname.lower().replace(" ", "_").replace("-", "_")
                     pval_lower = pval.lower()
 
-                    # Check DNP property
-                    if pname_normalized == "dnp":
-                        # DNP is true if value is yes/true/1/dnp OR if value is empty (boolean property)
-                        if pval_lower in ("yes", "true", "1", "dnp") or pval == "":
-                            skip = True
+                    # DNP is true if value is yes/true/1/dnp OR if value is empty (boolean property)
+                    if kind & _PROP_DNP and pval_lower in _DNP_TRUTHY:
+                        skip = True
 
-                    # Check Exclude from Board - multiple possible property names
-                    # KiCad uses "Exclude from board" which normalizes to "exclude_from_board"
-                    # Also check for ki_exclude_from_board variant
-                    if "exclude" in pname_normalized and "board" in pname_normalized:
-                        # For boolean properties, empty string means TRUE
-                        # Also accept yes/true/1
-                        if pval == "" or pval_lower in ("yes", "true", "1"):
-                            skip = True
-                            self._log(f"Excluding {ref}: property '{pname}' = '{pval}'")
+                    # Exclude from Board: for boolean properties, empty string
+                    # means TRUE. Also accept yes/true/1
+                    if kind & _PROP_EXCLUDE and pval_lower in _TRUTHY:
+                        skip = True
+                        pname = (child.get("name") or "").strip()
+                        excluded.append(f"{ref}: property '{pname}' = '{pval}'")
 
                 elif tag == "fields":
                     # Also check <fields> section for older KiCad versions
                     for field in child:
-                        fname = (field.get("name") or "").strip()
+                        if not _classify_prop(field.get("name") or "") & _PROP_EXCLUDE:
+                            continue
                         fval = (field.text or "").strip()
-                        fname_normalized = fname.lower().replace(" ", "_").replace("-", "_")
-                        fval_lower = fval.lower()
-
-                        if "exclude" in fname_normalized and "board" in fname_normalized:
-                            if fval == "" or fval_lower in ("yes", "true", "1"):
-                                skip = True
-                                self._log(f"Excluding {ref}: field '{fname}' = '{fval}'")
+                        if fval.lower() in _TRUTHY:
+                            skip = True
+                            fname = (field.get("name") or "").strip()
+                            excluded.append(f"{ref}: field '{fname}' = '{fval}'")
 
             # Also check if value is "DNP"
             if value.upper() == "DNP":
@@ -1184,8 +2166,13 @@ class MultiBoardManager:
                 "tstamp": tstamp,
                 "skip": skip,
             }
+            _release(elem)
 
-        return components
+        # One log write for the whole netlist rather than one per component
+        if excluded:
+            self._log(f"Excluding {len(excluded)} component(s) from board:\n  " + "\n  ".join(excluded))
+
+        return components, nets
 
     def _split_fpid(self, fpid: str) -> Tuple[str, str]:
         """Split a footprint ID into library nickname and footprint name."""
@@ -1202,8 +2189,8 @@ class MultiBoardManager:
             except Exception:
                 pass
 
-    def _assign_nets_optimized(self, board, netlist_path: Path, footprints: Dict):
-        """Optimized net assignment from netlist."""
+    def _assign_nets_optimized(self, board, netlist_nets: Dict[str, List[Tuple[str, str]]], footprints: Dict):
+        """Optimized net assignment from the parsed netlist nets."""
         nets = {name: net for name, net in board.GetNetsByName().items()}
 
         def get_net(name: str):
@@ -1213,32 +2200,29 @@ class MultiBoardManager:
                 nets[name] = ni
             return nets[name]
 
-        try:
-            from lxml import etree
-
-            parser = etree.iterparse(netlist_path, events=["end"], tag="net")
-            use_lxml = True
-        except ImportError:
-            import xml.etree.ElementTree as ET
-
-            parser = ET.iterparse(str(netlist_path), events=["end"])
-            use_lxml = False
-
-        for event, elem in parser:
-            if not use_lxml and elem.tag != "net":
+        # FindPadByNumber scans a footprint's pads linearly through SWIG on every
+        # node; one pass over all pads gives O(1) lookups instead. setdefault
+        # keeps the first pad per number, as FindPadByNumber does. Only
+        # footprints the netlist connects are indexed: block/port footprints
+        # and leftovers would cost a SWIG call per pad for nothing.
+        connected = {ref for nodes in netlist_nets.values() for ref, _ in nodes}
+        pads = {}
+        for ref, fp in footprints.items():
+            if ref not in connected:
                 continue
-
-            net_name = elem.get("name", "")
-            if net_name:
-                ni = get_net(net_name)
-                for node in elem.findall("node"):
-                    ref, pin = node.get("ref", ""), node.get("pin", "")
-                    fp = footprints.get(ref)
-                    if fp:
-                        pad = fp.FindPadByNumber(pin)
-                        if pad:
-                            pad.SetNet(ni)
-            elem.clear()
+            for pad in fp.Pads():
+                pads.setdefault((ref, pad.GetNumber()), pad)
+
+        # The netlist covers the whole project; a sub-board only holds a slice
+        # of it. Filter each net down to this board's pads first so nets with
+        # nothing here don't get a NETINFO_ITEM created and added to the board.
+        for net_name, nodes in netlist_nets.items():
+            net_pads = [pads[node] for node in nodes if node in pads]
+            if not net_pads:
+                continue
+            ni = get_net(net_name)
+            for pad in net_pads:
+                pad.SetNet(ni)
 
     def _pack_footprints(self, board, footprints: List):
         """
@@ -1272,21 +2256,20 @@ class MultiBoardManager:
 
     def get_status(self) -> Tuple[Dict[str, str], Set[str], int]:
         """Get component placement status across all boards."""
-        placed_raw = self.scan_all_boards()
+        # The netlist export (kicad-cli + XML, no pcbnew) runs in a worker
+        # while the boards are scanned here, as in update_all_boards
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            netlist_future = pool.submit(self._load_netlist)
+            placed_raw = self.scan_all_boards()
+            netlist = netlist_future.result()
         placed = {ref: board for ref, (board, _) in placed_raw.items()}
 
-        netlist = self._export_netlist()
-        if not netlist:
+        valid = self._included_refs_of(netlist[0] if netlist is not None else None)
+        if valid is None:
             return placed, set(), len(placed)
 
-        comps = self._parse_netlist_optimized(netlist)
-        try:
-            netlist.unlink()
-        except Exception:
-            pass
-
-        valid = {r for r, i in comps.items() if not i["skip"]}
-        return placed, valid - set(placed.keys()), len(valid)
+        # difference() takes the dict directly: no temporary set of its keys
+        return placed, valid.difference(placed), len(valid)
 
     # =========================================================================
     # Health Reports
@@ -1294,6 +2277,13 @@ class MultiBoardManager:
 
     def get_board_health(self, board_name: str, force: bool = False) -> dict:
         """Get health status for a board."""
+        health = self._board_health(board_name, force)
+        if self._scan_cache_dirty:
+            self._save_scan_cache()
+        return health
+
+    def _board_health(self, board_name: str, force: bool) -> dict:
+        """get_board_health() without writing the scan cache (see _scan_cache_dirty)."""
         if not force and board_name in self._health_cache:
             return self._health_cache[board_name]
 
@@ -1301,32 +2291,45 @@ class MultiBoardManager:
         if not board:
             return {"status": "error", "message": "Board not found"}
 
-        pcb_path = self.project_dir / board.pcb_path
+        pcb_path = self.get_pcb_path(board)
+        # A single stat answers both "exists" and "last modified"
+        st = _stat_or_none(pcb_path)
         health = {
             "status": "ok",
-            "exists": pcb_path.exists(),
+            "exists": st is not None,
             "components": 0,
             "is_open": self.is_pcb_open(pcb_path),
             "ports": len(board.ports),
             "last_modified": None,
         }
 
-        if not pcb_path.exists():
+        if st is None:
             health["status"] = "error"
             health["message"] = "PCB file missing"
             return health
 
-        try:
-            health["last_modified"] = datetime.fromtimestamp(pcb_path.stat().st_mtime).strftime("%Y-%m-%d %H:%M")
-        except Exception:
-            pass
+        health["last_modified"] = time.strftime("%Y-%m-%d %H:%M", time.localtime(st.st_mtime))
 
-        try:
-            pcb = pcbnew.LoadBoard(str(pcb_path))
-            health["components"] = len([fp for fp in pcb.GetFootprints() if not fp.GetReference().startswith("#")])
-        except Exception as e:
+        # Same per-file cache as scan_all_boards: an unchanged PCB (same
+        # mtime and size) is not read at all, and a changed one gets the text
+        # scan, so a health report no longer LoadBoards every sub-board.
+        fingerprint = (st.st_mtime_ns, st.st_size)
+        cached = self._board_scans.get(str(pcb_path))
+        if cached is not None and cached[0] == fingerprint:
+            refs = cached[1]
+        else:
+            refs = _scan_pcb_refs(pcb_path)
+            if refs is None:
+                refs = self._scan_pcb_refs_with_pcbnew(board_name, pcb_path)
+            if refs is not None:
+                self._board_scans[str(pcb_path)] = (fingerprint, refs)
+                self._scan_cache_dirty = True
+
+        if refs is None:
             health["status"] = "warning"
-            health["message"] = f"Load error: {e}"
+            health["message"] = "Load error: PCB could not be read"
+        else:
+            health["components"] = len(refs)
 
         self._health_cache[board_name] = health
         return health
@@ -1345,9 +2348,12 @@ class MultiBoardManager:
         for i, (name, board) in enumerate(self.config.boards.items()):
             if progress_callback:
                 progress_callback(int(100 * i / max(total, 1)), f"Checking {name}...")
-            health = self.get_board_health(name, force=True)
+            health = self._board_health(name, force=True)
             report["boards"][name] = health
             report["summary"][health["status"]] += 1
+        # Boards rescanned above are written out once, not once per board
+        if self._scan_cache_dirty:
+            self._save_scan_cache()
 
         if progress_callback:
             progress_callback(100, "Complete")
@@ -1364,9 +2370,8 @@ class MultiBoardManager:
             "component_count": {board1: 0, board2: 0},
         }
 
-        placed = self.scan_all_boards()
-        refs1 = {ref for ref, (b, _) in placed.items() if b == board1}
-        refs2 = {ref for ref, (b, _) in placed.items() if b == board2}
+        refs1 = self.get_board_refs(board1)
+        refs2 = self.get_board_refs(board2)
 
         diff["only_in_1"] = sorted(refs1 - refs2)
         diff["only_in_2"] = sorted(refs2 - refs1)
@@ -1404,19 +2409,10 @@ class MultiBoardManager:
 
     def _is_open_in_this_instance(self, pcb_path: Path) -> bool:
         """Best-effort check: is this *exact* board the active pcbnew board?"""
-        try:
-            b = pcbnew.GetBoard()
-            if not b:
-                return False
-            open_file = b.GetFileName() or ""
-            if not open_file:
-                return False
-            try:
-                return Path(open_file).resolve() == Path(pcb_path).resolve()
-            except Exception:
-                return Path(open_file).name == Path(pcb_path).name
-        except Exception:
+        active = self.get_active_board_path()
+        if active is None:
             return False
+        return active == self.resolve_path(pcb_path)
 
     def is_pcb_open(self, pcb_path: Path) -> bool:
         """
@@ -1442,13 +2438,27 @@ class MultiBoardManager:
         return False
 
     def get_open_boards(self) -> Set[str]:
-        """Return the set of board names currently open in KiCad."""
+        """
+        Return the set of board names currently open in KiCad.
+
+        Same checks as is_pcb_open(), but each board folder is listed once
+        instead of stat'ing the PCB and every lock-file candidate (four
+        syscalls per closed board, slow on network drives).
+        """
         open_boards: Set[str] = set()
+        listings: Dict[Path, Set[str]] = {}
 
         for name, cfg in self.config.boards.items():
             try:
-                pcb_path = self.project_dir / cfg.pcb_path
-                if pcb_path.exists() and self.is_pcb_open(pcb_path):
+                pcb_path = self.get_pcb_path(cfg)
+                names = listings.get(pcb_path.parent)
+                if names is None:
+                    names = listings[pcb_path.parent] = set(_list_dir_names(pcb_path.parent))
+                if pcb_path.name not in names:
+                    continue
+                if self._is_open_in_this_instance(pcb_path) or any(
+                    lock.name in names for lock in self._kicad_lock_paths(pcb_path)
+                ):
                     open_boards.add(name)
             except Exception:
                 pass